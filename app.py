@@ -2,17 +2,28 @@
 Web 应用主程序
 使用 Flask 展示采集的内容
 """
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from operator import itemgetter
+from functools import lru_cache
 from data_storage import DataStorage
 from config_manager import CategoryType
 
 app = Flask(__name__)
 
+# 直接输出 UTF-8，避免中文内容被逐字符转义而使响应体积翻倍
+app.json.ensure_ascii = False
+# 内容字典的键顺序已固定，不需要额外排序
+app.json.sort_keys = False
+
 # 数据存储管理器
 storage = DataStorage()
 
+# 数据快照的缓存，键为最新 collection 文件的 (文件名, mtime_ns, 大小)
+_snapshot_cache: Dict[tuple, Dict] = {}
+
 
 def load_latest_data():
     """
@@ -23,14 +34,92 @@ def load_latest_data():
     2. 对于失败的作者，尝试从历史 collection 文件中加载他们的数据
     3. 合并所有成功的数据，确保每个作者都有内容显示
     """
-    # 获取所有 collection_*.json 文件（完整的采集结果）
-    collection_files = storage.list_saved_files(pattern="collection_*.json")
+    snapshot = load_latest_snapshot()
+    return snapshot['data'] if snapshot else None
+
+
+def load_latest_snapshot() -> Optional[Dict]:
+    """
+    加载最新的数据快照
 
-    if not collection_files:
+    快照包含合并后的数据以及据此建立的查询索引，最新文件未变化时直接返回缓存，
+    避免每个请求都重新读取、解析和排序
+
+    Returns:
+        Dict: {'data': 合并后的数据, 'all_items': 全部内容, 'by_category': 分类到内容的映射}，
+              没有数据返回None
+    """
+    # 获取最新的 collection_*.json 文件（完整的采集结果）
+    latest_file = storage.get_latest_file(pattern="collection_*.json")
+
+    if not latest_file:
         return None
 
+    stat = latest_file.stat()
+    cache_key = (latest_file.name, stat.st_mtime_ns, stat.st_size)
+
+    cached = _snapshot_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    latest_data = _merge_collection_files(latest_file)
+    snapshot = _build_snapshot(latest_data) if latest_data else None
+
+    # 只保留最新快照，旧的缓存随之失效
+    _snapshot_cache.clear()
+    if snapshot:
+        _snapshot_cache[cache_key] = snapshot
+
+    return snapshot
+
+
+def _build_snapshot(data: Dict) -> Dict:
+    """
+    为合并后的数据建立查询索引
+
+    一次遍历收集所有成功结果中的内容，按发布时间倒序排列，并同时按分类分组
+
+    Args:
+        data: 合并后的采集数据
+
+    Returns:
+        Dict: 数据快照
+    """
+    # 收集内容的同时取出排序键，排序时不再逐项调用 lambda
+    keyed_items = []
+    append = keyed_items.append
+    for result in data.get('results', []):
+        if not result.get('success'):
+            continue
+        category = result.get('category')
+        for item in result.get('items') or ():
+            append((item.get('publish_date') or '', category, item))
+
+    # ISO 格式的时间字符串可直接按字典序比较
+    keyed_items.sort(key=itemgetter(0), reverse=True)
+
+    all_items = [item for _, _, item in keyed_items]
+    by_category: Dict[str, List[Dict]] = {}
+    for _, category, item in keyed_items:
+        group = by_category.get(category)
+        if group is None:
+            group = by_category[category] = []
+        group.append(item)
+
+    return {'data': data, 'all_items': all_items, 'by_category': by_category}
+
+
+def _merge_collection_files(latest_file: Path) -> Optional[Dict]:
+    """
+    合并最新 collection 文件与历史文件中失败作者的数据
+
+    Args:
+        latest_file: 最新的 collection 文件
+
+    Returns:
+        Dict: 合并后的数据，失败返回None
+    """
     # 加载最新的 collection 文件
-    latest_file = collection_files[0]
     latest_data = storage.load_results(latest_file.name)
 
     if not latest_data:
@@ -46,119 +135,211 @@ def load_latest_data():
         else:
             successful_authors.add(result.get('author_name'))
 
-    # 如果有失败的作者，尝试从历史数据中加载
+    if not failed_authors:
+        return latest_data
+
+    # 合并期间按作者名称索引结果，替换失败条目为 O(1) 操作
+    by_author = {r.get('author_name'): r for r in latest_data.get('results', [])}
+
+    # 优先通过作者索引直接读取失败作者最近一次成功的结果
+    author_index = storage.load_author_index()
+    for author_name in list(failed_authors):
+        entry = author_index.get(author_name)
+        if not entry:
+            continue
+
+        # 索引条目可能已过期，读到的结果必须属于该作者
+        result = storage.load_indexed_result(entry)
+        if not result or not result.get('success') or result.get('author_name') != author_name:
+            continue
+
+        # 索引中记录了采集时间，旧格式的条目则使用结果自身的采集时间
+        collected_at = entry[3] if len(entry) > 3 else result.get('collected_at')
+        _merge_history_result(latest_data, by_author, result, collected_at)
+        failed_authors.remove(author_name)
+        successful_authors.add(author_name)
+
+    # 索引中没有的作者，回退到逐条扫描历史 collection 文件
     if failed_authors:
-        # 遍历历史 collection 文件（从第二个开始）
-        for old_file in collection_files[1:]:
+        # 只有需要回退时才列出全部历史 collection 文件
+        collection_files = storage.list_saved_files(pattern="collection_*.json")
+
+        # 遍历历史 collection 文件（跳过最新的文件）
+        for old_file in collection_files:
             if not failed_authors:  # 所有失败的作者都找到了历史数据
                 break
 
-            old_data = storage.load_results(old_file.name)
-            if not old_data:
+            if old_file == latest_file:
                 continue
 
-            # 查找失败作者的历史成功数据
-            for result in old_data.get('results', []):
+            # 查找失败作者的历史成功数据，全部找到后立即停止解析
+            for result in storage.iter_results(old_file.name):
                 author_name = result.get('author_name')
                 if author_name in failed_authors and result.get('success'):
-                    # 找到了历史成功数据，添加到最新数据中
-                    # 先移除失败的条目
-                    latest_data['results'] = [
-                        r for r in latest_data['results']
-                        if r.get('author_name') != author_name
-                    ]
-                    # 添加历史成功数据（标记为来自历史）
-                    result['from_history'] = True
-                    result['history_collected_at'] = old_data.get('collected_at')
-                    latest_data['results'].append(result)
-
-                    # 更新统计
-                    latest_data['successful_authors'] = latest_data.get('successful_authors', 0) + 1
-                    latest_data['failed_authors'] = latest_data.get('failed_authors', 0) - 1
-                    latest_data['total_items'] = latest_data.get('total_items', 0) + len(result.get('items', []))
+                    _merge_history_result(latest_data, by_author, result, result.get('collected_at'))
 
                     # 从失败列表中移除
                     failed_authors.remove(author_name)
                     successful_authors.add(author_name)
 
+                    if not failed_authors:
+                        break
+
+    latest_data['results'] = list(by_author.values())
+
     return latest_data
 
 
-def format_publish_date(date_str):
+def _merge_history_result(latest_data: Dict, by_author: Dict[str, Dict], result: Dict,
+                          collected_at: Optional[str]):
+    """
+    用历史成功数据替换最新数据中失败的条目
+
+    Args:
+        latest_data: 最新的采集数据（用于更新统计）
+        by_author: 作者名称到采集结果的映射
+        result: 历史成功的采集结果
+        collected_at: 历史数据的采集时间
+    """
+    # 替换失败的条目为历史成功数据（标记为来自历史）
+    result['from_history'] = True
+    result['history_collected_at'] = collected_at
+    by_author[result.get('author_name')] = result
+
+    # 更新统计
+    latest_data['successful_authors'] = latest_data.get('successful_authors', 0) + 1
+    latest_data['failed_authors'] = latest_data.get('failed_authors', 0) - 1
+    latest_data['total_items'] = latest_data.get('total_items', 0) + len(result.get('items', []))
+
+
+# 发布时间分桶：分钟前 / 小时前 / 昨天 / 天前 / 具体日期
+_BUCKET_MINUTES, _BUCKET_HOURS, _BUCKET_YESTERDAY, _BUCKET_DAYS, _BUCKET_DATE = range(5)
+
+_ONE_SECOND = timedelta(seconds=1)
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso(date_str: str) -> datetime:
+    """解析 ISO 格式时间字符串（按原始字符串缓存，各接口重复出现的时间只解析一次）"""
+    return datetime.fromisoformat(date_str)
+
+
+def _date_bucket(delta_seconds: int) -> int:
+    """根据距今的整数秒数确定发布时间分桶"""
+    days = delta_seconds // 86400
+    if days == 0:
+        return _BUCKET_MINUTES if delta_seconds < 3600 else _BUCKET_HOURS
+    if days == 1:
+        return _BUCKET_YESTERDAY
+    if days < 7:
+        return _BUCKET_DAYS
+    return _BUCKET_DATE
+
+
+def format_publish_date(date_str, now: Optional[datetime] = None):
     """格式化发布时间"""
     if not date_str:
         return "未知时间"
 
     try:
-        dt = datetime.fromisoformat(date_str)
-        now = datetime.now()
-        delta = now - dt
-
-        if delta.days == 0:
-            if delta.seconds < 3600:
-                minutes = delta.seconds // 60
-                return f"{minutes} 分钟前"
-            else:
-                hours = delta.seconds // 3600
-                return f"{hours} 小时前"
-        elif delta.days == 1:
+        dt = _parse_iso(date_str)
+        if now is None:
+            now = datetime.now()
+        delta_seconds = (now - dt) // _ONE_SECOND
+
+        bucket = _date_bucket(delta_seconds)
+        if bucket == _BUCKET_MINUTES:
+            return f"{delta_seconds // 60} 分钟前"
+        elif bucket == _BUCKET_HOURS:
+            return f"{delta_seconds // 3600} 小时前"
+        elif bucket == _BUCKET_YESTERDAY:
             return "昨天"
-        elif delta.days < 7:
-            return f"{delta.days} 天前"
+        elif bucket == _BUCKET_DAYS:
+            return f"{delta_seconds // 86400} 天前"
         else:
             return dt.strftime("%Y-%m-%d")
     except:
         return "未知时间"
 
 
+def _with_formatted_date(item: Dict, now: datetime) -> Dict:
+    """
+    返回带格式化发布时间的内容副本
+
+    快照中的内容由所有请求共享，不能直接修改
+
+    Args:
+        item: 快照中的内容
+        now: 本次请求的当前时间
+
+    Returns:
+        Dict: 内容的浅拷贝，附加 formatted_date 字段
+    """
+    return {**item, 'formatted_date': format_publish_date(item.get('publish_date'), now)}
+
+
+def _items_response(items: List[Dict]) -> Response:
+    """
+    以流式 JSON 返回内容列表
+
+    逐条序列化内容并分块发送，不在内存中构建完整的响应体；
+    整个响应只获取一次当前时间
+
+    Args:
+        items: 内容列表
+
+    Returns:
+        Response: application/json 响应
+    """
+    now = datetime.now()
+
+    def generate():
+        yield '{"items":['
+        for idx, item in enumerate(items):
+            yield (',' if idx else '') + app.json.dumps(_with_formatted_date(item, now))
+        yield f'],"total":{len(items)}}}'
+
+    return Response(generate(), mimetype='application/json')
+
+
 @app.route('/')
 def index():
     """首页"""
-    data = load_latest_data()
+    snapshot = load_latest_snapshot()
 
-    if not data:
+    if not snapshot:
         return render_template('index.html',
                                collected_at="暂无数据",
                                categories=[],
                                items=[],
                                total_items=0)
 
-    # 整理数据
-    all_items = []
-    for result in data.get('results', []):
-        if result.get('success'):
-            for item in result.get('items', []):
-                # 添加格式化的发布时间
-                item['formatted_date'] = format_publish_date(item.get('publish_date'))
-                all_items.append(item)
+    data = snapshot['data']
 
-    # 按发布时间排序（最新的在前）
-    all_items.sort(key=lambda x: x.get('publish_date', ''), reverse=True)
+    # 快照中的内容已按发布时间排序（最新的在前）
+    now = datetime.now()
+    all_items = [_with_formatted_date(item, now) for item in snapshot['all_items']]
 
     # 统计分类
-    categories = {
-        'Video': {'name': 'Video', 'count': 0, 'icon': '🎥'},
-        'Podcast': {'name': 'Podcast', 'count': 0, 'icon': '🎙️'},
-        'News': {'name': 'News', 'count': 0, 'icon': '📰'}
-    }
-
-    for item in all_items:
-        category = item.get('category')
-        if category in categories:
-            categories[category]['count'] += 1
+    by_category = snapshot['by_category']
+    categories = [
+        {'name': 'Video', 'count': len(by_category.get('Video', [])), 'icon': '🎥'},
+        {'name': 'Podcast', 'count': len(by_category.get('Podcast', [])), 'icon': '🎙️'},
+        {'name': 'News', 'count': len(by_category.get('News', [])), 'icon': '📰'}
+    ]
 
     # 格式化采集时间
     collected_at = data.get('collected_at', '')
     if collected_at:
         try:
-            dt = datetime.fromisoformat(collected_at)
+            dt = _parse_iso(collected_at)
             collected_at = dt.strftime("%Y年%m月%d日 %H:%M")
         except:
             pass
 
     return render_template('index.html',
                            collected_at=collected_at,
-                           categories=list(categories.values()),
+                           categories=categories,
                            items=all_items,
                            total_items=len(all_items))
 
@@ -166,43 +347,24 @@ def index():
 @app.route('/api/items')
 def api_items():
     """API: 获取所有内容"""
-    data = load_latest_data()
+    snapshot = load_latest_snapshot()
 
-    if not data:
-        return jsonify({'items': [], 'total': 0})
-
-    all_items = []
-    for result in data.get('results', []):
-        if result.get('success'):
-            for item in result.get('items', []):
-                item['formatted_date'] = format_publish_date(item.get('publish_date'))
-                all_items.append(item)
+    if not snapshot:
+        return _items_response([])
 
-    # 按发布时间排序
-    all_items.sort(key=lambda x: x.get('publish_date', ''), reverse=True)
-
-    return jsonify({'items': all_items, 'total': len(all_items)})
+    return _items_response(snapshot['all_items'])
 
 
 @app.route('/api/items/<category>')
 def api_items_by_category(category):
     """API: 按分类获取内容"""
-    data = load_latest_data()
-
-    if not data:
-        return jsonify({'items': [], 'total': 0})
-
-    filtered_items = []
-    for result in data.get('results', []):
-        if result.get('success') and result.get('category') == category:
-            for item in result.get('items', []):
-                item['formatted_date'] = format_publish_date(item.get('publish_date'))
-                filtered_items.append(item)
+    snapshot = load_latest_snapshot()
 
-    # 按发布时间排序
-    filtered_items.sort(key=lambda x: x.get('publish_date', ''), reverse=True)
+    if not snapshot:
+        return _items_response([])
 
-    return jsonify({'items': filtered_items, 'total': len(filtered_items)})
+    # 分类索引在快照建立时已生成
+    return _items_response(snapshot['by_category'].get(category, []))
 
 
 @app.template_filter('truncate_desc')
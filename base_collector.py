@@ -2,10 +2,15 @@
 采集器基类
 定义统一的内容采集接口
 """
+import re
+import html
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Dict
 import requests
-from datetime import datetime, timedelta
+import feedparser
+from requests.adapters import HTTPAdapter
+from datetime import date, datetime, timedelta
 from content_model import ContentItem, CollectionResult
 from config_manager import Author, CategoryType
 
@@ -13,20 +18,59 @@ from config_manager import Author, CategoryType
 class BaseCollector(ABC):
     """采集器基类"""
 
-    def __init__(self, author: Author, timeout: int = 30):
+    USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+    # 连接池大小，需不小于 CollectorManager 的并发线程数
+    POOL_SIZE = 32
+
+    # 所有采集器共享的 HTTP 会话，复用到同一主机的 TCP/TLS 连接
+    _shared_session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    # 匹配 HTML 标签，用于从简介中剥离标签
+    _TAG_RE = re.compile(r'<[^>]+>')
+
+    # 简介的最大长度
+    DESCRIPTION_MAX_LENGTH = 500
+
+    def __init__(self, author: Author, timeout: int = 30, session: Optional[requests.Session] = None):
         """
         初始化采集器
 
         Args:
             author: 作者配置对象
             timeout: 请求超时时间（秒）
+            session: HTTP 会话，None则使用所有采集器共享的会话
         """
         self.author = author
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.session = session or BaseCollector._get_shared_session()
+
+        # Feed 条件请求缓存：上次成功解析时的 ETag / Last-Modified、内容及当时的条目数上限
+        self._feed_etag: Optional[str] = None
+        self._feed_last_modified: Optional[str] = None
+        self._feed_items: Optional[List[ContentItem]] = None
+        self._feed_max_items: int = 0
+
+    @staticmethod
+    def _get_shared_session() -> requests.Session:
+        """
+        获取共享的 HTTP 会话（首次调用时创建）
+
+        Returns:
+            requests.Session: 带连接池的会话
+        """
+        with BaseCollector._session_lock:
+            if BaseCollector._shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=BaseCollector.POOL_SIZE,
+                                      pool_maxsize=BaseCollector.POOL_SIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({'User-Agent': BaseCollector.USER_AGENT})
+                BaseCollector._shared_session = session
+
+            return BaseCollector._shared_session
 
     @abstractmethod
     def collect(self, max_items: int = 10) -> CollectionResult:
@@ -41,12 +85,13 @@ class BaseCollector(ABC):
         """
         pass
 
-    def collect_today_only(self, max_items: int = 10) -> CollectionResult:
+    def collect_today_only(self, max_items: int = 10, today: Optional[date] = None) -> CollectionResult:
         """
         只采集今天发布的内容
 
         Args:
             max_items: 最大采集条目数
+            today: 作为"今天"的日期，None则使用当前日期
 
         Returns:
             CollectionResult: 只包含今天发布内容的采集结果
@@ -55,7 +100,7 @@ class BaseCollector(ABC):
 
         if result.success:
             # 筛选今天的内容
-            today_items = result.get_today_items()
+            today_items = result.get_today_items(today)
             result.items = today_items
 
         return result
@@ -96,24 +141,110 @@ class BaseCollector(ABC):
             error_message=error_message
         )
 
-    def _fetch_url(self, url: str) -> Optional[requests.Response]:
+    @classmethod
+    def _clean_description(cls, description: str) -> str:
+        """
+        清理简介中的 HTML 标签并限制长度
+
+        只需要纯文本，用正则剥离标签再反转义实体，无需构建解析树
+
+        Args:
+            description: 可能包含 HTML 的简介
+
+        Returns:
+            清理后的纯文本简介
+        """
+        description = html.unescape(cls._TAG_RE.sub('', description)).strip()
+        if len(description) > cls.DESCRIPTION_MAX_LENGTH:
+            description = description[:cls.DESCRIPTION_MAX_LENGTH] + '...'
+        return description
+
+    def _fetch_url(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
         """
         获取URL内容
 
         Args:
             url: 目标URL
+            headers: 额外的请求头
 
         Returns:
             Response对象，失败返回None
         """
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             return response
         except requests.RequestException as e:
             print(f"请求失败 {url}: {e}")
             return None
 
+    def _fetch_feed(self, url: str, max_items: int) -> Optional[requests.Response]:
+        """
+        使用条件请求获取 Feed
+
+        携带上次成功解析时的 ETag / Last-Modified，Feed 未变化时服务器返回 304，
+        无需重新下载和解析；缓存的条目数不足本次上限时不发送条件请求
+
+        Args:
+            url: Feed URL
+            max_items: 本次最多采集的条目数
+
+        Returns:
+            Response对象（status_code 为 304 表示 Feed 未变化），失败返回None
+        """
+        headers = {}
+        if self._feed_items is not None and max_items <= self._feed_max_items:
+            if self._feed_etag:
+                headers['If-None-Match'] = self._feed_etag
+            if self._feed_last_modified:
+                headers['If-Modified-Since'] = self._feed_last_modified
+
+        return self._fetch_url(url, headers=headers)
+
+    @staticmethod
+    def _parse_feed(response: requests.Response):
+        """
+        解析已下载的 Feed 内容
+
+        Feed 内容由共享会话下载，不让 feedparser 自行建立连接
+
+        Args:
+            response: Feed 的响应
+
+        Returns:
+            feedparser 解析结果
+        """
+        return feedparser.parse(
+            response.content,
+            response_headers={'content-type': response.headers.get('Content-Type', '')}
+        )
+
+    def _cache_feed(self, response: requests.Response, items: List[ContentItem], max_items: int):
+        """
+        记录 Feed 的缓存校验信息和解析结果
+
+        Args:
+            response: Feed 的响应
+            items: 解析得到的内容列表
+            max_items: 解析时的条目数上限
+        """
+        self._feed_etag = response.headers.get('ETag')
+        self._feed_last_modified = response.headers.get('Last-Modified')
+        self._feed_items = items
+        self._feed_max_items = max_items
+
+    def _create_cached_feed_result(self, max_items: int) -> CollectionResult:
+        """
+        Feed 未变化时，使用缓存的内容创建采集结果
+
+        Args:
+            max_items: 本次最多采集的条目数
+
+        Returns:
+            CollectionResult: 成功的采集结果
+        """
+        return self._create_success_result(self._feed_items[:max_items])
+
     def _is_within_days(self, publish_date: datetime, days: int = 1) -> bool:
         """
         判断发布时间是否在指定天数内
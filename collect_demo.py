@@ -3,6 +3,7 @@
 演示完整的内容采集流程
 """
 import sys
+from datetime import date
 from pathlib import Path
 
 from config_manager import ConfigManager
@@ -62,7 +63,7 @@ def main():
 
     try:
         # 保存完整结果
-        filepath = storage.save_results(results)
+        filepath = storage.save_results(results, build_index=True)
         print(f"✓ 完整结果已保存: {filepath}")
 
         # 保存今天的内容
@@ -89,6 +90,9 @@ def main():
     print("[步骤 5] 采集结果详情")
     print("=" * 70)
 
+    # 结果展示和汇总使用同一个"今天"
+    today = date.today()
+
     for result in results:
         print(f"\n作者: {result.author_name}")
         print(f"分类: {result.category.value}")
@@ -97,7 +101,7 @@ def main():
             print(f"状态: ✓ 成功")
             print(f"总内容: {len(result.items)} 条")
 
-            today_items = result.get_today_items()
+            today_items = result.get_today_items(today)
             if today_items:
                 print(f"今天发布: {len(today_items)} 条")
                 print("\n今天的内容:")
@@ -131,7 +135,7 @@ def main():
 
     successful = [r for r in results if r.success]
     total_items = sum(len(r.items) for r in successful)
-    total_today = sum(len(r.get_today_items()) for r in successful)
+    total_today = sum(len(r.get_today_items(today)) for r in successful)
 
     print(f"\n✓ 成功: {len(successful)}/{len(results)} 个作者")
     print(f"✓ 总内容: {total_items} 条")
@@ -2,35 +2,64 @@
 采集管理器
 统一管理所有内容采集器
 """
-from typing import List, Dict
-from datetime import datetime
+from typing import List, Dict, Callable, Iterator, Tuple, Optional
+from datetime import date
+from functools import partial
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed, Future
 
 from config_manager import ConfigManager, Author
 from content_model import CollectionResult
 from youtube_collector import create_collector
 from base_collector import BaseCollector
+from news_collector import FeedUrlCache
 
 
 class CollectorManager:
     """采集管理器"""
 
-    def __init__(self, config_manager: ConfigManager):
+    # 默认的最大并发采集数（采集以网络 I/O 为主）
+    MAX_WORKERS = 16
+
+    def __init__(self, config_manager: ConfigManager, max_workers: int = None,
+                 storage_dir: Optional[Path] = None):
         """
         初始化采集管理器
 
         Args:
             config_manager: 配置管理器实例
+            max_workers: 最大并发采集数，None则使用 MAX_WORKERS；
+                不超过共享连接池的大小，否则多出的连接会被丢弃而无法复用
+            storage_dir: 数据存储目录，Feed 地址缓存保存在此目录；None则使用默认存储目录
         """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("最大并发数必须大于0")
+
         self.config_manager = config_manager
+        self.max_workers = min(max_workers or self.MAX_WORKERS, BaseCollector.POOL_SIZE)
+        self.feed_url_cache = None
+        if storage_dir is not None:
+            self.feed_url_cache = FeedUrlCache(Path(storage_dir) / FeedUrlCache.FILENAME)
         self.collectors: Dict[str, BaseCollector] = {}
         self._initialize_collectors()
 
     def _initialize_collectors(self):
-        """根据配置初始化所有采集器"""
+        """
+        根据配置初始化所有采集器
+
+        创建采集器时可能需要联网（解析 YouTube 频道ID、发现 Feed 地址），
+        因此使用线程池并发创建，按配置顺序登记
+        """
         enabled_authors = self.config_manager.get_enabled_authors()
+        if not enabled_authors:
+            return
+
+        max_workers = max(1, min(len(enabled_authors), self.max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            factory = partial(create_collector, feed_url_cache=self.feed_url_cache)
+            collectors = list(executor.map(factory, enabled_authors))
 
-        for author in enabled_authors:
-            collector = create_collector(author)
+        for author, collector in zip(enabled_authors, collectors):
             if collector:
                 self.collectors[author.name] = collector
             else:
@@ -49,24 +78,28 @@ class CollectorManager:
         if max_items_per_author is None:
             max_items_per_author = self.config_manager.settings.max_items_per_author
 
-        results = []
         total = len(self.collectors)
 
         print(f"\n开始采集，共 {total} 个作者...")
         print("=" * 60)
 
-        for idx, (author_name, collector) in enumerate(self.collectors.items(), 1):
-            print(f"\n[{idx}/{total}] 正在采集: {author_name}")
+        # 本次采集使用同一个"今天"
+        today = date.today()
+
+        results_by_author: Dict[str, CollectionResult] = {}
+        completed = self._iter_completed(lambda c: c.collect(max_items=max_items_per_author))
+
+        for idx, (author_name, collector, future) in enumerate(completed, 1):
+            print(f"\n[{idx}/{total}] 采集完成: {author_name}")
             print(f"  URL: {collector.author.url}")
             print(f"  分类: {collector.author.category.value}")
 
             try:
-                result = collector.collect(max_items=max_items_per_author)
-                results.append(result)
+                result = future.result()
 
                 if result.success:
                     print(f"  ✓ 成功采集 {len(result.items)} 条内容")
-                    today_items = result.get_today_items()
+                    today_items = result.get_today_items(today)
                     if today_items:
                         print(f"  📅 今天发布: {len(today_items)} 条")
                 else:
@@ -82,11 +115,15 @@ class CollectorManager:
                     success=False,
                     error_message=str(e)
                 )
-                results.append(result)
+
+            results_by_author[author_name] = result
+
+        # 按配置顺序返回结果
+        results = [results_by_author[author_name] for author_name in self.collectors]
 
         print("\n" + "=" * 60)
         print(f"采集完成！")
-        self._print_summary(results)
+        self._print_summary(results, today)
 
         return results
 
@@ -103,18 +140,24 @@ class CollectorManager:
         if max_items_per_author is None:
             max_items_per_author = self.config_manager.settings.max_items_per_author
 
-        results = []
         total = len(self.collectors)
 
         print(f"\n开始采集今天的内容，共 {total} 个作者...")
         print("=" * 60)
 
-        for idx, (author_name, collector) in enumerate(self.collectors.items(), 1):
-            print(f"\n[{idx}/{total}] 正在采集: {author_name}")
+        # 本次采集使用同一个"今天"
+        today = date.today()
+
+        results_by_author: Dict[str, CollectionResult] = {}
+        completed = self._iter_completed(
+            lambda c: c.collect_today_only(max_items=max_items_per_author, today=today)
+        )
+
+        for idx, (author_name, collector, future) in enumerate(completed, 1):
+            print(f"\n[{idx}/{total}] 采集完成: {author_name}")
 
             try:
-                result = collector.collect_today_only(max_items=max_items_per_author)
-                results.append(result)
+                result = future.result()
 
                 if result.success:
                     if result.items:
@@ -133,14 +176,40 @@ class CollectorManager:
                     success=False,
                     error_message=str(e)
                 )
-                results.append(result)
+
+            results_by_author[author_name] = result
+
+        results = [results_by_author[author_name] for author_name in self.collectors]
 
         print("\n" + "=" * 60)
         print(f"采集完成！")
-        self._print_summary(results)
+        self._print_summary(results, today)
 
         return results
 
+    def _iter_completed(
+        self, collect: Callable[[BaseCollector], CollectionResult]
+    ) -> Iterator[Tuple[str, BaseCollector, Future]]:
+        """
+        使用线程池并发执行所有采集器，按完成顺序逐个返回
+
+        Args:
+            collect: 对单个采集器执行采集的函数
+
+        Yields:
+            Tuple[str, BaseCollector, Future]: 作者名称、采集器和已完成的 Future
+        """
+        max_workers = max(1, min(len(self.collectors), self.max_workers))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(collect, collector): author_name
+                for author_name, collector in self.collectors.items()
+            }
+            for future in as_completed(futures):
+                author_name = futures[future]
+                yield author_name, self.collectors[author_name], future
+
     def collect_by_author(self, author_name: str, max_items: int = None) -> CollectionResult:
         """
         采集指定作者的内容
@@ -168,18 +237,20 @@ class CollectorManager:
         collector = self.collectors[author_name]
         return collector.collect(max_items=max_items)
 
-    def _print_summary(self, results: List[CollectionResult]):
+    def _print_summary(self, results: List[CollectionResult], today: Optional[date] = None):
         """
         打印采集汇总信息
 
         Args:
             results: 采集结果列表
+            today: 作为"今天"的日期，None则使用当前日期
         """
         successful = [r for r in results if r.success]
         failed = [r for r in results if not r.success]
 
         total_items = sum(len(r.items) for r in successful)
-        total_today = sum(len(r.get_today_items()) for r in successful)
+        today = today or date.today()
+        total_today = sum(len(r.get_today_items(today)) for r in successful)
 
         print(f"\n采集汇总:")
         print(f"  - 成功: {len(successful)}/{len(results)} 个作者")
@@ -198,4 +269,4 @@ class CollectorManager:
 
     def __repr__(self) -> str:
         """字符串表示"""
-        return f"CollectorManager(collectors={len(self.collectors)})"
+        return f"CollectorManager(collectors={len(self.collectors)}, max_workers={self.max_workers})"
@@ -16,7 +16,11 @@ class CategoryType(Enum):
     NEWS = "News"
 
 
-@dataclass
+# 分类字符串到枚举成员的映射，避免每次构造对象都调用 CategoryType(...)
+CATEGORY_BY_VALUE: Dict[str, CategoryType] = {member.value: member for member in CategoryType}
+
+
+@dataclass(slots=True)
 class Author:
     """作者配置数据类"""
     name: str
@@ -31,7 +35,7 @@ class Author:
         if not self.url or not self.url.startswith(("http://", "https://")):
             raise ValueError(f"无效的URL: {self.url}")
         if isinstance(self.category, str):
-            self.category = CategoryType(self.category)
+            self.category = CATEGORY_BY_VALUE.get(self.category) or CategoryType(self.category)
 
     def to_dict(self) -> Dict:
         """转换为字典"""
@@ -43,7 +47,7 @@ class Author:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """全局设置数据类"""
     check_interval_minutes: int = 60
@@ -88,8 +92,7 @@ class ConfigManager:
         if not self.config_path.exists():
             raise FileNotFoundError(f"配置文件不存在: {self.config_path}")
 
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+        config_data = json.loads(self.config_path.read_bytes())
 
         # 加载设置
         if "settings" in config_data:
@@ -99,20 +102,31 @@ class ConfigManager:
         if "authors" not in config_data:
             raise ValueError("配置文件缺少 'authors' 字段")
 
-        self.authors = []
-        for author_data in config_data["authors"]:
-            try:
-                author = Author(**author_data)
-                self.authors.append(author)
-            except Exception as e:
-                print(f"警告: 跳过无效的作者配置 {author_data.get('name', 'Unknown')}: {e}")
-                continue
+        parsed = [self._parse_author(author_data) for author_data in config_data["authors"]]
+        self.authors = [author for author in parsed if author is not None]
 
         if not self.authors:
             raise ValueError("配置文件中没有有效的作者")
 
         return True
 
+    @staticmethod
+    def _parse_author(author_data: Dict) -> Optional[Author]:
+        """
+        从配置数据创建作者，无效时打印警告并跳过
+
+        Args:
+            author_data: 单个作者的配置数据
+
+        Returns:
+            Author: 作者对象，无效返回None
+        """
+        try:
+            return Author(**author_data)
+        except Exception as e:
+            print(f"警告: 跳过无效的作者配置 {author_data.get('name', 'Unknown')}: {e}")
+            return None
+
     def get_enabled_authors(self) -> List[Author]:
         """
         获取所有启用的作者
@@ -149,8 +163,12 @@ class ConfigManager:
             }
         }
 
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, ensure_ascii=False, indent=2)
+        # 一次性编码后整体写入；json.dump 会按编码片段逐次调用 write
+        # 配置文件需要人工编辑，保留缩进格式
+        self.config_path.write_text(
+            json.dumps(config_data, ensure_ascii=False, indent=2),
+            encoding='utf-8'
+        )
 
         return True
 
@@ -2,13 +2,40 @@
 内容数据模型
 定义采集内容的数据结构
 """
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
-from typing import Optional, List, Dict
-from config_manager import CategoryType
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Optional, List, Dict, Tuple
+from config_manager import CategoryType, CATEGORY_BY_VALUE
 
 
-@dataclass
+def _today_bounds(today: Optional[date] = None) -> Tuple[datetime, datetime]:
+    """
+    获取今天的起止时间（本地时间，左闭右开区间）
+
+    Args:
+        today: 作为"今天"的日期，None则使用当前日期
+    """
+    start = datetime.combine(today or date.today(), time())
+    return start, start + timedelta(days=1)
+
+
+def _in_bounds(value: datetime, start: datetime, end: datetime) -> bool:
+    """
+    判断时间是否落在区间内
+
+    带时区的时间（如旧版本保存的数据）先转换为本地时间再比较
+
+    Args:
+        value: 要判断的时间
+        start: 区间起始时间（本地时间，包含）
+        end: 区间结束时间（本地时间，不包含）
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return start <= value < end
+
+
+@dataclass(slots=True)
 class ContentItem:
     """内容项数据类"""
 
@@ -48,23 +75,28 @@ class ContentItem:
 
         # 确保 category 是 CategoryType 枚举
         if isinstance(self.category, str):
-            self.category = CategoryType(self.category)
+            self.category = CATEGORY_BY_VALUE.get(self.category) or CategoryType(self.category)
 
     def to_dict(self) -> Dict:
         """转换为字典，用于 JSON 序列化"""
-        data = asdict(self)
-
-        # 转换枚举为字符串
-        data['category'] = self.category.value
-
-        # 转换 datetime 为 ISO 格式字符串
-        if self.publish_date:
-            data['publish_date'] = self.publish_date.isoformat()
-
-        if self.collected_at:
-            data['collected_at'] = self.collected_at.isoformat()
-
-        return data
+        # 直接构建字典，避免 asdict 对每个字段做递归深拷贝
+        return {
+            'title': self.title,
+            'url': self.url,
+            'author_name': self.author_name,
+            'author_url': self.author_url,
+            'category': self.category.value,
+            'description': self.description,
+            'publish_date': self.publish_date.isoformat() if self.publish_date else None,
+            'thumbnail_url': self.thumbnail_url,
+            'cover_image_url': self.cover_image_url,
+            'images': list(self.images),
+            'duration': self.duration,
+            'views': self.views,
+            'tags': list(self.tags),
+            'collected_at': self.collected_at.isoformat() if self.collected_at else None,
+            'content_id': self.content_id
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'ContentItem':
@@ -74,7 +106,7 @@ class ContentItem:
 
         # 转换字符串为枚举
         if 'category' in data and isinstance(data['category'], str):
-            data['category'] = CategoryType(data['category'])
+            data['category'] = CATEGORY_BY_VALUE.get(data['category']) or CategoryType(data['category'])
 
         # 转换 ISO 格式字符串为 datetime
         if 'publish_date' in data and isinstance(data['publish_date'], str):
@@ -90,8 +122,7 @@ class ContentItem:
         if not self.publish_date:
             return False
 
-        today = datetime.now().date()
-        return self.publish_date.date() == today
+        return _in_bounds(self.publish_date, *_today_bounds())
 
     def get_primary_image(self) -> Optional[str]:
         """获取主要图片（优先缩略图，其次封面图）"""
@@ -102,7 +133,7 @@ class ContentItem:
         return f"ContentItem(title='{self.title[:30]}...', author='{self.author_name}', category={self.category.value})"
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionResult:
     """采集结果数据类"""
 
@@ -127,9 +158,27 @@ class CollectionResult:
             'total_items': len(self.items)
         }
 
-    def get_today_items(self) -> List[ContentItem]:
-        """获取今天发布的内容"""
-        return [item for item in self.items if item.is_today()]
+    def get_today_items(self, today: Optional[date] = None) -> List[ContentItem]:
+        """
+        获取今天发布的内容
+
+        今天的起止时间只计算一次，不必为每条内容重新获取当前日期
+
+        Args:
+            today: 作为"今天"的日期，None则使用当前日期；批量处理时传入同一个日期，
+                保证所有结果使用一致的"今天"
+
+        Returns:
+            List[ContentItem]: 今天发布的内容列表
+        """
+        if not self.items:
+            return []
+
+        start, end = _today_bounds(today)
+        return [
+            item for item in self.items
+            if item.publish_date is not None and _in_bounds(item.publish_date, start, end)
+        ]
 
     def __repr__(self) -> str:
         """字符串表示"""
@@ -2,17 +2,44 @@
 数据存储模块
 负责将采集的数据保存到JSON文件
 """
+import os
+import re
 import json
+import fnmatch
+import tempfile
+from contextlib import contextmanager, nullcontext
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, BinaryIO
 
 from content_model import CollectionResult, ContentItem
 
+# 流式读取时跳过数组元素之间的空白和逗号
+_ARRAY_SEPARATOR_RE = re.compile(r'[\s,]*')
+
+# 进程的文件创建掩码：os.umask 只能通过设置来读取，并且对整个进程生效，
+# 因此在导入时（尚未开始并发写入）读取一次并立即恢复
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# 复用的紧凑 JSON 编码器（无缩进、无多余空白）；json.dumps 传入非默认参数时每次调用都会新建编码器
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
 
 class DataStorage:
     """数据存储管理器"""
 
+    # 作者索引文件：作者名称 -> [NDJSON 文件名, 字节偏移, 长度, 采集时间]
+    AUTHOR_INDEX_FILENAME = "author_index.json"
+
+    # 按作者保存文件时的最大并发写入数
+    MAX_WRITE_WORKERS = 16
+
+    # 文件名非法字符替换表，一次 translate 完成全部替换
+    _ILLEGAL_CHARS_TABLE = str.maketrans('/\\:*?"<>|', '_' * 9)
+
     def __init__(self, storage_dir: Path = None):
         """
         初始化数据存储管理器
@@ -26,13 +53,18 @@ class DataStorage:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-    def save_results(self, results: List[CollectionResult], filename: str = None) -> Path:
+    def save_results(self, results: List[CollectionResult], filename: str = None,
+                     build_index: bool = False, pretty: bool = False) -> Path:
         """
         保存采集结果到JSON文件
 
+        采集结果由程序读取，默认写入紧凑格式；需要人工查看时可使用缩进格式
+
         Args:
             results: 采集结果列表
             filename: 文件名，None则自动生成（格式：collection_YYYYMMDD_HHMMSS.json）
+            build_index: 是否同时写入 NDJSON 文件并更新作者索引
+            pretty: 是否使用缩进格式
 
         Returns:
             Path: 保存的文件路径
@@ -46,23 +78,200 @@ class DataStorage:
             filename += '.json'
 
         filepath = self.storage_dir / filename
+        ndjson_path = filepath.with_suffix('.ndjson')
+        collected_at = datetime.now().isoformat()
 
-        # 转换为可序列化的字典
-        data = {
-            'collected_at': datetime.now().isoformat(),
+        # 统计信息只需遍历一次结果对象；内容本身逐条序列化写入，不在内存中构建完整的数据
+        successful = sum(1 for r in results if r.success)
+        header = {
+            'collected_at': collected_at,
             'total_authors': len(results),
-            'successful_authors': sum(1 for r in results if r.success),
-            'failed_authors': sum(1 for r in results if not r.success),
-            'total_items': sum(len(r.items) for r in results if r.success),
-            'results': [result.to_dict() for result in results]
+            'successful_authors': successful,
+            'failed_authors': len(results) - successful,
+            'total_items': sum(len(r.items) for r in results if r.success)
         }
 
-        # 写入文件
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if pretty:
+            # 去掉头部的结尾括号，接着写入 results 数组
+            header_text = json.dumps(header, ensure_ascii=False, indent=2)
+            opening = header_text[:-2] + ',\n  "results": ['
+            separator, first_separator, closing = b',\n    ', b'\n    ', b'\n  ]\n}\n'
+        else:
+            opening = _COMPACT_ENCODER.encode(header)[:-1] + ',"results":['
+            separator, first_separator, closing = b',', b'', b']}\n'
+
+        index = None
+        if build_index:
+            # 同名 NDJSON 将被重写，指向它的旧条目（包括本次失败的作者）已失效
+            index = {
+                name: entry for name, entry in self.load_author_index().items()
+                if entry[0] != ndjson_path.name
+            }
+
+        with self._atomic_file(filepath) as f, \
+                (self._atomic_file(ndjson_path) if build_index else nullcontext()) as ndjson_file:
+            f.write(opening.encode('utf-8'))
+
+            for idx, result in enumerate(results):
+                data = result.to_dict()
+                line = _COMPACT_ENCODER.encode(data).encode('utf-8')
+                if pretty:
+                    entry = json.dumps(data, ensure_ascii=False, indent=2).replace('\n', '\n    ').encode('utf-8')
+                else:
+                    entry = line
+                f.write((separator if idx else first_separator) + entry)
+
+                # 紧凑编码同时作为 NDJSON 的一行，并记录成功作者的字节偏移
+                if ndjson_file is not None:
+                    offset = ndjson_file.tell()
+                    ndjson_file.write(line + b'\n')
+
+                    # 只索引成功的结果，失败时保留作者上一次成功的位置
+                    if result.success:
+                        index[result.author_name] = [ndjson_path.name, offset, len(line) + 1, collected_at]
+
+            f.write(closing)
+
+        if build_index:
+            self._write_json(self.storage_dir / self.AUTHOR_INDEX_FILENAME, index, indent=None)
+        elif ndjson_path.exists():
+            # 同名 NDJSON 未随本次保存更新，删除以免读到过期内容
+            self._remove_stale_ndjson(ndjson_path)
 
         return filepath
 
+    def _remove_stale_ndjson(self, ndjson_path: Path):
+        """
+        删除过期的 NDJSON 文件，并移除作者索引中指向它的条目
+
+        Args:
+            ndjson_path: NDJSON 文件路径
+        """
+        ndjson_path.unlink(missing_ok=True)
+
+        index = self.load_author_index()
+        stale = [name for name, entry in index.items() if entry[0] == ndjson_path.name]
+        if stale:
+            for name in stale:
+                del index[name]
+            self._write_json(self.storage_dir / self.AUTHOR_INDEX_FILENAME, index, indent=None)
+
+    def _write_json(self, filepath: Path, data, indent: Optional[int] = 2):
+        """
+        将数据序列化为 JSON 并写入文件
+
+        先在内存中一次性编码，再以单次写入落盘；json.dump 会按编码片段逐次写入
+
+        Args:
+            filepath: 目标文件路径
+            data: 可序列化的数据
+            indent: 缩进空格数，None 表示紧凑格式
+        """
+        if indent is None:
+            text = _COMPACT_ENCODER.encode(data)
+        else:
+            text = json.dumps(data, ensure_ascii=False, indent=indent)
+        self._write_bytes(filepath, text.encode('utf-8'))
+
+    def _write_bytes(self, filepath: Path, data: bytes):
+        """
+        通过原始文件描述符原子写入字节数据
+
+        不经过 Python 的缓冲层，整个数据通常只需一次 write 系统调用
+
+        Args:
+            filepath: 目标文件路径
+            data: 要写入的字节数据
+        """
+        with self._atomic_file(filepath, buffering=0) as f:
+            view = memoryview(data)
+            while view:
+                written = f.write(view)
+                view = view[written:]
+
+    @contextmanager
+    def _atomic_file(self, filepath: Path, buffering: int = -1) -> Iterator[BinaryIO]:
+        """
+        原子写入文件：先写入同目录下的临时文件，成功后再替换目标文件
+
+        写入中途崩溃只会留下临时文件，目标文件始终是完整的旧内容或新内容
+
+        Args:
+            filepath: 目标文件路径
+            buffering: 缓冲策略，0 表示不缓冲
+
+        Yields:
+            BinaryIO: 以二进制写模式打开的临时文件
+        """
+        # 临时文件不以 .json 结尾，避免被 list_saved_files 等匹配到
+        fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix='.tmp_', suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb', buffering=buffering) as f:
+                yield f
+            # mkstemp 创建的文件权限为 0600，改为与普通 open 一致的 0666 & ~umask
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _read_json(self, filepath: Path):
+        """
+        读取并解析 JSON 文件
+
+        一次读入全部字节再整体解码，不经过文本层的分块解码
+
+        Args:
+            filepath: 文件路径
+
+        Returns:
+            解析后的数据
+        """
+        with open(filepath, 'rb') as f:
+            return json.loads(f.read().decode('utf-8'))
+
+    def load_author_index(self) -> Dict[str, List]:
+        """
+        加载作者索引
+
+        Returns:
+            Dict[str, List]: 作者名称到 [文件名, 偏移, 长度, 采集时间] 的映射，不存在返回空字典
+        """
+        index_path = self.storage_dir / self.AUTHOR_INDEX_FILENAME
+
+        if not index_path.exists():
+            return {}
+
+        try:
+            return self._read_json(index_path)
+        except Exception as e:
+            print(f"加载作者索引失败: {e}")
+            return {}
+
+    def load_indexed_result(self, entry: List) -> Optional[Dict]:
+        """
+        根据作者索引条目直接读取单个采集结果
+
+        Args:
+            entry: 索引条目 [文件名, 偏移, 长度, 采集时间]
+
+        Returns:
+            Dict: 采集结果数据，失败返回None
+        """
+        filename, offset, length = entry[:3]
+        filepath = self.storage_dir / filename
+
+        try:
+            with open(filepath, 'rb') as f:
+                f.seek(offset)
+                return json.loads(f.read(length))
+        except Exception as e:
+            print(f"读取索引数据失败: {e}")
+            return None
+
     def save_today_items_only(self, results: List[CollectionResult], filename: str = None) -> Path:
         """
         只保存今天发布的内容到JSON文件
@@ -74,15 +283,15 @@ class DataStorage:
         Returns:
             Path: 保存的文件路径
         """
+        today = datetime.now().date()
         if filename is None:
-            today = datetime.now().strftime("%Y%m%d")
-            filename = f"today_{today}.json"
+            filename = f"today_{today.strftime('%Y%m%d')}.json"
 
         # 筛选今天的内容
         today_results = []
         for result in results:
             if result.success:
-                today_items = result.get_today_items()
+                today_items = result.get_today_items(today)
                 if today_items:
                     # 创建新的结果对象，只包含今天的内容
                     from content_model import CollectionResult
@@ -102,31 +311,44 @@ class DataStorage:
         """
         按作者分别保存内容到不同的JSON文件
 
+        各作者的文件相互独立，使用线程池并发序列化和写入
+
         Args:
             results: 采集结果列表
 
         Returns:
             Dict[str, Path]: 作者名称到文件路径的映射
         """
-        saved_files = {}
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        to_save = [result for result in results if result.success and result.items]
 
-        for result in results:
-            if result.success and result.items:
-                # 生成安全的文件名
-                safe_name = self._sanitize_filename(result.author_name)
-                filename = f"{safe_name}_{timestamp}.json"
-                filepath = self.storage_dir / filename
+        if not to_save:
+            return {}
 
-                # 保存单个作者的数据
-                data = result.to_dict()
+        max_workers = min(self.MAX_WRITE_WORKERS, len(to_save))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            paths = list(executor.map(lambda result: self._write_one_author(result, timestamp), to_save))
+
+        return {result.author_name: path for result, path in zip(to_save, paths)}
+
+    def _write_one_author(self, result: CollectionResult, timestamp: str) -> Path:
+        """
+        保存单个作者的数据
 
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+        Args:
+            result: 采集结果
+            timestamp: 文件名中的时间戳
+
+        Returns:
+            Path: 保存的文件路径
+        """
+        # 生成安全的文件名
+        safe_name = self._sanitize_filename(result.author_name)
+        filepath = self.storage_dir / f"{safe_name}_{timestamp}.json"
 
-                saved_files[result.author_name] = filepath
+        self._write_json(filepath, result.to_dict(), indent=None)
 
-        return saved_files
+        return filepath
 
     def load_results(self, filename: str) -> Optional[Dict]:
         """
@@ -145,13 +367,100 @@ class DataStorage:
             return None
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data
+            return self._read_json(filepath)
         except Exception as e:
             print(f"加载文件失败: {e}")
             return None
 
+    def iter_results(self, filename: str) -> Iterator[Dict]:
+        """
+        逐条读取文件中的采集结果
+
+        存在同名 NDJSON 文件时逐行解析，调用方找到所需结果后即可停止迭代，
+        不必解析整个文件；否则回退到流式解码 JSON 文件
+
+        Args:
+            filename: JSON 文件名
+
+        Yields:
+            Dict: 单个采集结果数据
+        """
+        ndjson_path = (self.storage_dir / filename).with_suffix('.ndjson')
+
+        if ndjson_path.exists():
+            try:
+                with open(ndjson_path, 'rb') as f:
+                    for line in f:
+                        yield json.loads(line)
+                return
+            except Exception as e:
+                print(f"读取 NDJSON 文件失败: {e}")
+                return
+
+        yield from self.load_results_streaming(filename)
+
+    def load_results_streaming(self, filename: str, key: str = 'results',
+                               chunk_size: int = 1 << 16) -> Iterator[Dict]:
+        """
+        流式读取JSON文件中的采集结果数组
+
+        分块读取文件，逐个解码数组元素，不在内存中构建完整的数据树；
+        适用于 save_results 写入的文件（数组所在的键出现在元素之前）
+
+        Args:
+            filename: 文件名
+            key: 数组所在的键
+            chunk_size: 每次读取的字符数
+
+        Yields:
+            Dict: 单个数组元素
+        """
+        filepath = self.storage_dir / filename
+
+        if not filepath.exists():
+            print(f"文件不存在: {filepath}")
+            return
+
+        decoder = json.JSONDecoder()
+        array_start = re.compile(re.escape(json.dumps(key, ensure_ascii=False)) + r'\s*:\s*\[')
+
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                # 定位数组的起始位置
+                buffer = ''
+                while True:
+                    chunk = f.read(chunk_size)
+                    buffer += chunk
+                    match = array_start.search(buffer)
+                    if match:
+                        break
+                    if not chunk:
+                        return
+
+                pos = match.end()
+                while True:
+                    pos = _ARRAY_SEPARATOR_RE.match(buffer, pos).end()
+
+                    if pos < len(buffer):
+                        if buffer[pos] == ']':
+                            return
+                        try:
+                            obj, pos = decoder.raw_decode(buffer, pos)
+                            yield obj
+                            continue
+                        except json.JSONDecodeError:
+                            # 元素不完整，继续读取
+                            pass
+
+                    # 读取量不小于当前缓冲区，避免大元素被反复重新解码
+                    chunk = f.read(max(chunk_size, len(buffer) - pos))
+                    if not chunk:
+                        raise ValueError("文件内容不完整")
+                    buffer = buffer[pos:] + chunk
+                    pos = 0
+        except Exception as e:
+            print(f"流式读取文件失败: {e}")
+
     def list_saved_files(self, pattern: str = "*.json") -> List[Path]:
         """
         列出所有保存的JSON文件
@@ -160,20 +469,64 @@ class DataStorage:
             pattern: 文件匹配模式
 
         Returns:
-            List[Path]: 文件路径列表
+            List[Path]: 文件路径列表，按修改时间从新到旧排列
         """
-        files = sorted(self.storage_dir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
-        return files
+        entries = self._scan_files(pattern)
+        entries.sort(key=itemgetter(1), reverse=True)
+        return [self.storage_dir / name for name, _ in entries]
 
-    def get_latest_file(self) -> Optional[Path]:
+    def get_latest_file(self, pattern: str = "*.json") -> Optional[Path]:
         """
         获取最新的JSON文件
 
+        只需找出修改时间最大的文件，一次扫描目录即可，不对全部文件排序
+
+        Args:
+            pattern: 文件匹配模式
+
         Returns:
             Path: 最新文件路径，没有文件则返回None
         """
-        files = self.list_saved_files()
-        return files[0] if files else None
+        entries = self._scan_files(pattern)
+
+        if not entries:
+            return None
+
+        name, _ = max(entries, key=itemgetter(1))
+        return self.storage_dir / name
+
+    def _scan_files(self, pattern: str) -> List[tuple]:
+        """
+        扫描存储目录中匹配模式的文件
+
+        使用 os.scandir 一次读取目录，DirEntry 的类型和 stat 信息来自目录读取结果，
+        不必为每个文件构建 Path 对象；作者索引和隐藏的缓存文件不是采集结果，不会列出
+
+        Args:
+            pattern: 文件匹配模式
+
+        Returns:
+            List[tuple]: (文件名, 修改时间纳秒) 列表
+        """
+        with os.scandir(self.storage_dir) as entries:
+            return [
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.is_file() and not self._is_sidecar_file(entry.name)
+                and fnmatch.fnmatch(entry.name, pattern)
+            ]
+
+    def _is_sidecar_file(self, name: str) -> bool:
+        """
+        判断是否为存储目录中的辅助文件（作者索引、以 . 开头的缓存文件等）
+
+        Args:
+            name: 文件名
+
+        Returns:
+            bool: 是辅助文件返回True
+        """
+        return name.startswith('.') or name == self.AUTHOR_INDEX_FILENAME
 
     def _sanitize_filename(self, name: str) -> str:
         """
@@ -185,20 +538,8 @@ class DataStorage:
         Returns:
             str: 安全的文件名
         """
-        # 移除或替换非法字符
-        illegal_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-        sanitized = name
-        for char in illegal_chars:
-            sanitized = sanitized.replace(char, '_')
-
-        # 移除前后空格
-        sanitized = sanitized.strip()
-
-        # 限制长度
-        if len(sanitized) > 100:
-            sanitized = sanitized[:100]
-
-        return sanitized
+        # 替换非法字符并移除前后空格，限制长度
+        return name.translate(self._ILLEGAL_CHARS_TABLE).strip()[:100]
 
     def create_summary_report(self, results: List[CollectionResult]) -> Dict:
         """
@@ -210,22 +551,34 @@ class DataStorage:
         Returns:
             Dict: 摘要报告
         """
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
+        successful = []
+        failed = []
+        total_items = 0
+        total_today = 0
 
-        total_items = sum(len(r.items) for r in successful)
-        total_today = sum(len(r.get_today_items()) for r in successful)
+        # 整个报告使用同一个"当前时间"
+        now = datetime.now()
+        today = now.date()
 
-        # 按分类统计
+        # 一次遍历同时完成成功/失败分组、总数统计和按分类统计
         category_stats = {}
-        for result in successful:
-            category = result.category.value
-            if category not in category_stats:
-                category_stats[category] = {'authors': 0, 'items': 0, 'today_items': 0}
-
-            category_stats[category]['authors'] += 1
-            category_stats[category]['items'] += len(result.items)
-            category_stats[category]['today_items'] += len(result.get_today_items())
+        for result in results:
+            if not result.success:
+                failed.append(result)
+                continue
+
+            successful.append(result)
+            items_count = len(result.items)
+            today_count = len(result.get_today_items(today))
+            total_items += items_count
+            total_today += today_count
+
+            stats = category_stats.setdefault(
+                result.category.value, {'authors': 0, 'items': 0, 'today_items': 0}
+            )
+            stats['authors'] += 1
+            stats['items'] += items_count
+            stats['today_items'] += today_count
 
         report = {
             'summary': {
@@ -234,7 +587,7 @@ class DataStorage:
                 'failed_authors': len(failed),
                 'total_items': total_items,
                 'today_items': total_today,
-                'collection_time': datetime.now().isoformat()
+                'collection_time': now.isoformat()
             },
             'by_category': category_stats,
             'successful_authors': [r.author_name for r in successful],
@@ -265,8 +618,7 @@ class DataStorage:
 
         report = self.create_summary_report(results)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        self._write_json(filepath, report)
 
         return filepath
 
@@ -2,20 +2,161 @@
 News/Blog 采集器
 通过 RSS/Atom Feed 采集新闻和博客内容
 """
-import feedparser
-from typing import Optional, List
+import re
+import json
+import time
+import atexit
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict
 from datetime import datetime
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from base_collector import BaseCollector
 from content_model import ContentItem, CollectionResult
 from config_manager import CategoryType
 
+# URL 中出现这些关键字时视为已经是 Feed 地址
+_FEED_HINT = re.compile(r'feed|rss|atom')
+
+# 页面中声明 Feed 地址的 link 标签
+_RSS_LINK_XPATH = etree.XPath("//link[@type='application/rss+xml'][normalize-space(@href)]/@href")
+_ATOM_LINK_XPATH = etree.XPath("//link[@type='application/atom+xml'][normalize-space(@href)]/@href")
+
+# 有未写回修改的 Feed 地址缓存，进程退出时统一保存
+_pending_caches: set = set()
+_pending_lock = threading.Lock()
+
+# 默认的 Feed 地址缓存，首次使用时创建
+_default_cache: Optional["FeedUrlCache"] = None
+_default_cache_lock = threading.Lock()
+
+
+@atexit.register
+def _save_pending_caches():
+    """进程退出时保存所有有修改的 Feed 地址缓存"""
+    with _pending_lock:
+        caches = list(_pending_caches)
+    for cache in caches:
+        cache.save()
+
+
+class FeedUrlCache:
+    """
+    Feed 地址的持久化缓存
+
+    站点的 Feed 地址几乎不会变化，缓存自动发现的结果，避免每次运行都抓取并解析站点首页。
+    文件格式：{站点地址: [Feed 地址, 发现时间戳]}，进程退出时统一写回
+    """
+
+    # 缓存有效期（秒）
+    TTL_SECONDS = 30 * 24 * 3600
+
+    # 存储目录中的缓存文件名
+    FILENAME = ".feed_url_cache.json"
+
+    def __init__(self, cache_path: Path):
+        """
+        初始化 Feed 地址缓存
+
+        Args:
+            cache_path: 缓存文件路径
+        """
+        self.cache_path = Path(cache_path)
+        self._entries: Optional[Dict[str, List]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, List]:
+        """首次访问时从文件加载缓存（需持有锁）"""
+        if self._entries is None:
+            try:
+                entries = json.loads(self.cache_path.read_bytes())
+            except (OSError, ValueError):
+                entries = None
+            # 文件内容不是预期的对象时视为空缓存
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        查询站点的 Feed 地址
+
+        Args:
+            url: 站点地址
+
+        Returns:
+            str: 未过期的 Feed 地址，没有则返回None
+        """
+        with self._lock:
+            entry = self._load().get(url)
+
+        # 格式不正确的条目视为未命中
+        if not (isinstance(entry, list) and len(entry) == 2
+                and isinstance(entry[0], str) and isinstance(entry[1], (int, float))):
+            return None
+
+        if time.time() - entry[1] < self.TTL_SECONDS:
+            return entry[0]
+        return None
+
+    def set(self, url: str, feed_url: str):
+        """
+        记录站点的 Feed 地址
+
+        Args:
+            url: 站点地址
+            feed_url: 发现的 Feed 地址
+        """
+        with self._lock:
+            self._load()[url] = [feed_url, time.time()]
+            self._dirty = True
+
+            # 登记到退出时保存的列表，保存后移除
+            with _pending_lock:
+                _pending_caches.add(self)
+
+    def save(self):
+        """将缓存写回文件（先写临时文件再替换）"""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_name(self.cache_path.name + '.part')
+                tmp_path.write_text(json.dumps(self._entries, ensure_ascii=False), encoding='utf-8')
+                tmp_path.replace(self.cache_path)
+                self._dirty = False
+            except OSError as e:
+                print(f"保存 Feed 地址缓存失败: {e}")
+                return
+
+            with _pending_lock:
+                _pending_caches.discard(self)
+
+
+def get_default_feed_url_cache() -> FeedUrlCache:
+    """
+    获取默认的 Feed 地址缓存（位于 DataStorage 的默认存储目录）
+
+    Returns:
+        FeedUrlCache: 首次调用时创建的共享缓存
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = FeedUrlCache(Path(__file__).parent / "data" / FeedUrlCache.FILENAME)
+        return _default_cache
+
 
 class NewsCollector(BaseCollector):
     """新闻/博客内容采集器"""
 
-    def __init__(self, author, timeout=30):
-        super().__init__(author, timeout)
+    def __init__(self, author, timeout=30, session=None, feed_url_cache: Optional[FeedUrlCache] = None):
+        super().__init__(author, timeout, session)
+        self.feed_url_cache = feed_url_cache if feed_url_cache is not None else get_default_feed_url_cache()
         self.feed_url = self._get_feed_url()
 
     def _get_feed_url(self) -> str:
@@ -30,32 +171,52 @@ class NewsCollector(BaseCollector):
         url = self.author.url.rstrip('/')
 
         # 如果已经是 feed URL，直接返回
-        if any(keyword in url.lower() for keyword in ['feed', 'rss', 'atom']):
+        if _FEED_HINT.search(url.lower()):
             return url
 
         # Simon Willison 特殊处理
         if 'simonwillison.net' in url:
             return 'https://simonwillison.net/atom/everything/'
 
+        # 优先使用缓存的自动发现结果
+        cached = self.feed_url_cache.get(url)
+        if cached:
+            return cached
+
         # 尝试通用的 feed URL 模式
         # 先尝试获取页面，检查是否有 feed 链接
+        feed_url = self._discover_feed_url(url)
+        if feed_url:
+            self.feed_url_cache.set(url, feed_url)
+            return feed_url
+
+        # 如果没找到，尝试常见的 feed 路径
+        return url + '/feed/'
+
+    def _discover_feed_url(self, url: str) -> Optional[str]:
+        """
+        获取站点页面，从 link 标签中发现 Feed 地址
+
+        Args:
+            url: 站点地址
+
+        Returns:
+            str: Feed 地址，未找到返回None
+        """
         try:
-            response = self._make_request(url)
+            response = self._fetch_url(url)
             if response:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                tree = lxml_html.fromstring(response.content)
 
-                # 查找 RSS/Atom link
-                feed_link = soup.find('link', {'type': 'application/rss+xml'})
-                if not feed_link:
-                    feed_link = soup.find('link', {'type': 'application/atom+xml'})
+                # 查找 RSS/Atom link（优先 RSS）
+                hrefs = _RSS_LINK_XPATH(tree) or _ATOM_LINK_XPATH(tree)
 
-                if feed_link and feed_link.get('href'):
-                    feed_href = feed_link['href']
+                if hrefs:
+                    feed_href = hrefs[0]
                     # 处理相对路径
                     if feed_href.startswith('http'):
                         return feed_href
                     elif feed_href.startswith('/'):
-                        from urllib.parse import urlparse
                         parsed = urlparse(url)
                         return f"{parsed.scheme}://{parsed.netloc}{feed_href}"
                     else:
@@ -63,8 +224,7 @@ class NewsCollector(BaseCollector):
         except:
             pass
 
-        # 如果没找到，尝试常见的 feed 路径
-        return url + '/feed/'
+        return None
 
     def collect(self, max_items: int = 10) -> CollectionResult:
         """
@@ -77,8 +237,15 @@ class NewsCollector(BaseCollector):
             CollectionResult: 采集结果
         """
         try:
-            # 解析 Feed
-            feed = feedparser.parse(self.feed_url)
+            # 使用条件请求获取 Feed，未变化时直接返回缓存的内容
+            response = self._fetch_feed(self.feed_url, max_items)
+            if response is None:
+                return self._create_error_result("获取 Feed 失败")
+
+            if response.status_code == 304:
+                return self._create_cached_feed_result(max_items)
+
+            feed = self._parse_feed(response)
 
             if not feed.entries:
                 return self._create_error_result(f"Feed 中没有找到任何条目")
@@ -97,6 +264,7 @@ class NewsCollector(BaseCollector):
             if not items:
                 return self._create_error_result("未能解析任何有效的新闻条目")
 
+            self._cache_feed(response, items, max_items)
             return self._create_success_result(items)
 
         except Exception as e:
@@ -124,34 +292,24 @@ class NewsCollector(BaseCollector):
             return None
 
         # 提取简介（尝试多个字段）
-        description = ''
-        if hasattr(entry, 'summary'):
-            description = entry.summary
-        elif hasattr(entry, 'description'):
-            description = entry.description
-        elif hasattr(entry, 'content'):
-            description = entry.content[0].value if entry.content else ''
+        content = entry.get('content')
+        description = (
+            entry.get('summary')
+            or entry.get('description')
+            or (content[0].get('value', '') if content else '')
+        )
 
         # 清理 HTML 标签
         if description:
-            soup = BeautifulSoup(description, 'html.parser')
-            description = soup.get_text().strip()
-            # 限制长度
-            if len(description) > 500:
-                description = description[:500] + '...'
+            description = self._clean_description(description)
 
         # 提取发布时间
         publish_date = None
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            try:
-                publish_date = datetime(*entry.published_parsed[:6])
-            except:
-                pass
-
         # 如果没有 published，尝试 updated
-        if not publish_date and hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+        parsed_time = entry.get('published_parsed') or entry.get('updated_parsed')
+        if parsed_time:
             try:
-                publish_date = datetime(*entry.updated_parsed[:6])
+                publish_date = datetime(*parsed_time[:6])
             except:
                 pass
 
@@ -159,20 +317,22 @@ class NewsCollector(BaseCollector):
         cover_image_url = None
 
         # 1. 尝试从 media:thumbnail 获取
-        if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-            if len(entry.media_thumbnail) > 0:
-                cover_image_url = entry.media_thumbnail[0].get('url')
+        media_thumbnail = entry.get('media_thumbnail')
+        if media_thumbnail:
+            cover_image_url = media_thumbnail[0].get('url')
 
         # 2. 尝试从 media:content 获取
-        if not cover_image_url and hasattr(entry, 'media_content') and entry.media_content:
-            for media in entry.media_content:
+        media_content = entry.get('media_content')
+        if not cover_image_url and media_content:
+            for media in media_content:
                 if media.get('medium') == 'image' or 'image' in media.get('type', ''):
                     cover_image_url = media.get('url')
                     break
 
-        # 3. 尝试从 summary 中提取第一张图片
-        if not cover_image_url and hasattr(entry, 'summary'):
-            soup = BeautifulSoup(entry.summary, 'html.parser')
+        # 3. 尝试从 summary 中提取第一张图片（仅当其中包含图片标签时才解析）
+        summary = entry.get('summary', '')
+        if not cover_image_url and '<img' in summary:
+            soup = BeautifulSoup(summary, 'lxml')
             img = soup.find('img')
             if img and img.get('src'):
                 img_src = img['src']
@@ -180,7 +340,6 @@ class NewsCollector(BaseCollector):
                 if img_src.startswith('http'):
                     cover_image_url = img_src
                 elif img_src.startswith('/'):
-                    from urllib.parse import urlparse
                     parsed = urlparse(link)
                     cover_image_url = f"{parsed.scheme}://{parsed.netloc}{img_src}"
 
@@ -2,19 +2,22 @@
 Podcast 采集器
 通过 RSS Feed 采集播客内容
 """
-import feedparser
+import re
 from typing import Optional, List
 from datetime import datetime
 from base_collector import BaseCollector
 from content_model import ContentItem, CollectionResult
 from config_manager import CategoryType
 
+# URL 中出现这些关键字时视为已经是 RSS 地址
+_RSS_HINT = re.compile(r'feed|rss')
+
 
 class PodcastCollector(BaseCollector):
     """Podcast 内容采集器"""
 
-    def __init__(self, author, timeout=30):
-        super().__init__(author, timeout)
+    def __init__(self, author, timeout=30, session=None):
+        super().__init__(author, timeout, session)
         self.rss_url = self._get_rss_url()
 
     def _get_rss_url(self) -> str:
@@ -28,7 +31,7 @@ class PodcastCollector(BaseCollector):
         url = self.author.url.rstrip('/')
 
         # 如果已经是 feed URL，直接返回
-        if 'feed' in url.lower() or 'rss' in url.lower():
+        if _RSS_HINT.search(url.lower()):
             return url
 
         # Lex Fridman 特殊处理
@@ -55,8 +58,15 @@ class PodcastCollector(BaseCollector):
             CollectionResult: 采集结果
         """
         try:
-            # 解析 RSS Feed
-            feed = feedparser.parse(self.rss_url)
+            # 使用条件请求获取 Feed，未变化时直接返回缓存的内容
+            response = self._fetch_feed(self.rss_url, max_items)
+            if response is None:
+                return self._create_error_result("获取 Feed 失败")
+
+            if response.status_code == 304:
+                return self._create_cached_feed_result(max_items)
+
+            feed = self._parse_feed(response)
 
             if not feed.entries:
                 return self._create_error_result(f"RSS Feed 中没有找到任何条目")
@@ -75,6 +85,7 @@ class PodcastCollector(BaseCollector):
             if not items:
                 return self._create_error_result("未能解析任何有效的 Podcast 条目")
 
+            self._cache_feed(response, items, max_items)
             return self._create_success_result(items)
 
         except Exception as e:
@@ -102,29 +113,23 @@ class PodcastCollector(BaseCollector):
             return None
 
         # 提取简介（尝试多个字段）
-        description = ''
-        if hasattr(entry, 'summary'):
-            description = entry.summary
-        elif hasattr(entry, 'description'):
-            description = entry.description
-        elif hasattr(entry, 'content'):
-            description = entry.content[0].value if entry.content else ''
+        content = entry.get('content')
+        description = (
+            entry.get('summary')
+            or entry.get('description')
+            or (content[0].get('value', '') if content else '')
+        )
 
         # 清理 HTML 标签
         if description:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(description, 'html.parser')
-            description = soup.get_text().strip()
-            # 限制长度
-            if len(description) > 500:
-                description = description[:500] + '...'
+            description = self._clean_description(description)
 
         # 提取发布时间
         publish_date = None
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+        published_parsed = entry.get('published_parsed')
+        if published_parsed:
             try:
-                from datetime import datetime
-                publish_date = datetime(*entry.published_parsed[:6])
+                publish_date = datetime(*published_parsed[:6])
             except:
                 pass
 
@@ -132,24 +137,22 @@ class PodcastCollector(BaseCollector):
         cover_image_url = None
 
         # 1. 尝试从条目的 itunes:image 获取
-        if hasattr(entry, 'image'):
-            if isinstance(entry.image, dict) and 'href' in entry.image:
-                cover_image_url = entry.image['href']
-            elif isinstance(entry.image, str):
-                cover_image_url = entry.image
+        image = entry.get('image')
+        if isinstance(image, dict) and 'href' in image:
+            cover_image_url = image['href']
+        elif isinstance(image, str):
+            cover_image_url = image
 
         # 2. 尝试从 media:thumbnail 获取
-        if not cover_image_url and hasattr(entry, 'media_thumbnail'):
-            if entry.media_thumbnail and len(entry.media_thumbnail) > 0:
-                cover_image_url = entry.media_thumbnail[0].get('url')
+        media_thumbnail = entry.get('media_thumbnail')
+        if not cover_image_url and media_thumbnail:
+            cover_image_url = media_thumbnail[0].get('url')
 
         # 3. 使用频道级别的图片
-        if not cover_image_url and hasattr(feed, 'feed'):
-            if hasattr(feed.feed, 'image'):
-                if isinstance(feed.feed.image, dict) and 'href' in feed.feed.image:
-                    cover_image_url = feed.feed.image['href']
-                elif isinstance(feed.feed.image, dict) and 'url' in feed.feed.image:
-                    cover_image_url = feed.feed.image['url']
+        if not cover_image_url:
+            feed_image = feed.get('feed', {}).get('image')
+            if isinstance(feed_image, dict):
+                cover_image_url = feed_image.get('href') or feed_image.get('url')
 
         # 提取唯一 ID
         content_id = entry.get('id', link)
@@ -0,0 +1,176 @@
+"""
+Web 应用测试文件
+测试数据快照缓存、失败作者的数据合并和 API 接口
+"""
+import os
+import json
+import pytest
+from datetime import datetime, timedelta
+
+import app as web_app
+from config_manager import CategoryType
+from content_model import ContentItem, CollectionResult
+from data_storage import DataStorage
+
+
+def make_result(author_name: str, success: bool = True, count: int = 1,
+                category: CategoryType = CategoryType.VIDEO) -> CollectionResult:
+    """创建示例采集结果"""
+    author_url = f"https://example.com/{author_name}"
+    items = [
+        ContentItem(
+            title=f"{author_name} {idx}",
+            url=f"{author_url}/{idx}",
+            author_name=author_name,
+            author_url=author_url,
+            category=category,
+            publish_date=datetime.now() - timedelta(hours=idx)
+        )
+        for idx in range(count)
+    ] if success else []
+
+    return CollectionResult(
+        author_name=author_name,
+        author_url=author_url,
+        category=category,
+        success=success,
+        items=items,
+        error_message=None if success else "采集失败"
+    )
+
+
+def touch(path, offset_seconds: int):
+    """调整文件修改时间，保证 collection 文件的新旧顺序"""
+    mtime_ns = (int(datetime.now().timestamp()) + offset_seconds) * 10 ** 9
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """使用临时目录的数据存储，并清空快照缓存"""
+    storage = DataStorage(storage_dir=tmp_path)
+    monkeypatch.setattr(web_app, 'storage', storage)
+    web_app._snapshot_cache.clear()
+    yield storage
+    web_app._snapshot_cache.clear()
+
+
+class TestSnapshot:
+    """测试数据快照缓存"""
+
+    def test_cache_hit_and_invalidation(self, storage):
+        """测试最新文件未变化时复用快照，文件重写后重新加载"""
+        path = storage.save_results([make_result("A")], filename="collection_1.json")
+        touch(path, -10)
+
+        snapshot = web_app.load_latest_snapshot()
+        assert web_app.load_latest_snapshot() is snapshot
+        assert len(snapshot['all_items']) == 1
+
+        storage.save_results([make_result("A", count=3)], filename="collection_1.json")
+        touch(path, 0)
+
+        reloaded = web_app.load_latest_snapshot()
+        assert reloaded is not snapshot
+        assert len(reloaded['all_items']) == 3
+        assert [item['title'] for item in reloaded['by_category']['Video']] == ["A 0", "A 1", "A 2"]
+
+    def test_no_data(self, storage):
+        """测试没有采集文件时返回None"""
+        assert web_app.load_latest_snapshot() is None
+
+
+class TestMergeCollectionFiles:
+    """测试失败作者的历史数据合并"""
+
+    def test_merge_from_author_index(self, storage):
+        """测试通过作者索引合并失败作者最近一次成功的数据"""
+        old = storage.save_results([make_result("A", count=2), make_result("B")],
+                                   filename="collection_1.json", build_index=True)
+        touch(old, -10)
+        latest = storage.save_results([make_result("A", success=False), make_result("B")],
+                                      filename="collection_2.json", build_index=True)
+
+        data = web_app._merge_collection_files(latest)
+        by_author = {r['author_name']: r for r in data['results']}
+
+        assert by_author["A"]['success'] and by_author["A"]['from_history']
+        assert len(by_author["A"]['items']) == 2
+        assert not by_author["B"].get('from_history')
+        assert data['successful_authors'] == 2
+        assert data['failed_authors'] == 0
+        assert data['total_items'] == 3
+
+    def test_merge_from_history_files(self, storage):
+        """测试没有作者索引时回退到扫描历史 collection 文件"""
+        old = storage.save_results([make_result("A", count=2)], filename="collection_1.json")
+        touch(old, -10)
+        latest = storage.save_results([make_result("A", success=False), make_result("B")],
+                                      filename="collection_2.json")
+
+        data = web_app._merge_collection_files(latest)
+        by_author = {r['author_name']: r for r in data['results']}
+
+        assert by_author["A"]['from_history']
+        old_result = storage.load_results("collection_1.json")['results'][0]
+        assert by_author["A"]['history_collected_at'] == old_result['collected_at']
+        assert data['total_items'] == 3
+
+    def test_reject_mismatched_index_entry(self, storage):
+        """测试索引条目指向其他作者的结果时不采用，回退到历史文件"""
+        old = storage.save_results([make_result("A", count=2)], filename="collection_1.json")
+        touch(old, -10)
+        latest = storage.save_results([make_result("B"), make_result("A", success=False)],
+                                      filename="collection_2.json", build_index=True)
+
+        # 构造过期的索引：A 的条目指向 B 的结果
+        index = storage.load_author_index()
+        index["A"] = index["B"]
+        (storage.storage_dir / storage.AUTHOR_INDEX_FILENAME).write_text(json.dumps(index), encoding='utf-8')
+
+        data = web_app._merge_collection_files(latest)
+        by_author = {r['author_name']: r for r in data['results']}
+
+        assert [item['title'] for item in by_author["A"]['items']] == ["A 0", "A 1"]
+        assert len(by_author["B"]['items']) == 1
+        assert data['total_items'] == 3
+
+
+class TestApi:
+    """测试 API 接口"""
+
+    @pytest.fixture
+    def client(self, storage):
+        """Flask 测试客户端（已写入示例数据）"""
+        storage.save_results([
+            make_result("A", count=2),
+            make_result("P", category=CategoryType.PODCAST),
+        ], filename="collection_1.json")
+        return web_app.app.test_client()
+
+    def test_api_items(self, client):
+        """测试获取所有内容"""
+        response = client.get('/api/items')
+        data = json.loads(response.data)
+
+        assert response.mimetype == 'application/json'
+        assert data['total'] == len(data['items']) == 3
+        assert all(item['formatted_date'] for item in data['items'])
+
+        # 格式化时间只出现在响应中，不写回快照
+        snapshot = web_app.load_latest_snapshot()
+        assert all('formatted_date' not in item for item in snapshot['all_items'])
+
+    def test_api_items_by_category(self, client):
+        """测试按分类获取内容"""
+        data = json.loads(client.get('/api/items/Podcast').data)
+        assert data['total'] == len(data['items']) == 1
+        assert data['items'][0]['author_name'] == "P"
+
+        data = json.loads(client.get('/api/items/Unknown').data)
+        assert data == {'items': [], 'total': 0}
+
+    def test_api_items_without_data(self, storage):
+        """测试没有数据时返回空列表"""
+        data = json.loads(web_app.app.test_client().get('/api/items').data)
+        assert data == {'items': [], 'total': 0}
@@ -4,16 +4,43 @@
 """
 import pytest
 import json
-from pathlib import Path
-from datetime import datetime, timedelta
-import tempfile
-import shutil
+from datetime import datetime, timedelta, timezone
+from dataclasses import fields
 
 from config_manager import ConfigManager, Author, CategoryType
 from content_model import ContentItem, CollectionResult
 from collector_manager import CollectorManager
+from base_collector import BaseCollector
+import data_storage
 from data_storage import DataStorage
-from youtube_collector import YouTubeCollector
+from youtube_collector import YouTubeCollector, create_collector
+from podcast_collector import PodcastCollector
+import news_collector
+from news_collector import NewsCollector, FeedUrlCache
+
+
+class FakeResponse:
+    """模拟的 HTTP 响应"""
+
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """按顺序返回预设响应的模拟会话，并记录每次请求的请求头"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
 
 
 class TestContentItem:
@@ -35,23 +62,16 @@ class TestContentItem:
         assert item.url == "https://youtube.com/watch?v=test123"
         assert item.category == CategoryType.VIDEO
 
-    def test_content_item_invalid_title(self):
-        """测试空标题应抛出异常"""
-        with pytest.raises(ValueError, match="标题不能为空"):
+    @pytest.mark.parametrize("title,url,message", [
+        ("", "https://example.com", "标题不能为空"),
+        ("Test", "invalid-url", "无效的内容URL"),
+    ])
+    def test_content_item_invalid(self, title, url, message):
+        """测试空标题或无效URL应抛出异常"""
+        with pytest.raises(ValueError, match=message):
             ContentItem(
-                title="",
-                url="https://example.com",
-                author_name="Test",
-                author_url="https://example.com",
-                category=CategoryType.VIDEO
-            )
-
-    def test_content_item_invalid_url(self):
-        """测试无效URL应抛出异常"""
-        with pytest.raises(ValueError, match="无效的内容URL"):
-            ContentItem(
-                title="Test",
-                url="invalid-url",
+                title=title,
+                url=url,
                 author_name="Test",
                 author_url="https://example.com",
                 category=CategoryType.VIDEO
@@ -72,6 +92,23 @@ class TestContentItem:
         assert data['category'] == "Podcast"
         assert 'collected_at' in data
 
+    def test_content_item_to_dict_covers_all_fields(self):
+        """测试 to_dict 包含所有字段且可以还原"""
+        item = ContentItem(
+            title="Test",
+            url="https://example.com/video",
+            author_name="Author",
+            author_url="https://example.com",
+            category=CategoryType.VIDEO,
+            publish_date=datetime(2025, 11, 10, 10, 0, 0),
+            tags=["ai"]
+        )
+
+        data = item.to_dict()
+        assert set(data) == {f.name for f in fields(ContentItem)}
+        assert data['publish_date'] == "2025-11-10T10:00:00"
+        assert ContentItem.from_dict(data) == item
+
     def test_content_item_from_dict(self):
         """测试从字典创建对象"""
         data = {
@@ -113,6 +150,12 @@ class TestContentItem:
         )
         assert yesterday_item.is_today() is False
 
+        # 带时区的发布时间按本地时间判断
+        today_item.publish_date = datetime.now().astimezone(timezone.utc)
+        assert today_item.is_today() is True
+        yesterday_item.publish_date = yesterday_item.publish_date.astimezone(timezone.utc)
+        assert yesterday_item.is_today() is False
+
     def test_get_primary_image(self):
         """测试获取主要图片"""
         # 有缩略图
@@ -199,22 +242,49 @@ class TestCollectionResult:
         assert len(today_items) == 1
         assert today_items[0].title == "Today"
 
+        # 内容列表或发布时间变化后结果同步更新
+        result.items.append(today_item)
+        assert len(result.get_today_items()) == 2
+
+        result.items = [old_item]
+        assert result.get_today_items() == []
+
+        result.items[0] = today_item
+        assert result.get_today_items() == [today_item]
+
+        today_item.publish_date = old_item.publish_date
+        assert result.get_today_items() == []
+        today_item.publish_date = datetime.now()
+
+        # 带时区的发布时间按本地时间判断
+        aware_item = ContentItem.from_dict({
+            **today_item.to_dict(),
+            'publish_date': datetime.now().astimezone(timezone.utc).isoformat()
+        })
+        result.items = [aware_item, old_item]
+        assert result.get_today_items() == [aware_item]
+
+        # 指定"今天"的日期
+        old_day = old_item.publish_date.date()
+        assert result.get_today_items(old_day) == [old_item]
+
 
 class TestDataStorage:
     """测试数据存储功能"""
 
     @pytest.fixture
-    def temp_storage_dir(self):
-        """创建临时存储目录"""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        # 清理
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+    def temp_storage_dir(self, tmp_path_factory):
+        """创建临时存储目录（由 pytest 统一清理）"""
+        return tmp_path_factory.mktemp("storage")
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def shared_storage(self, tmp_path_factory):
+        """列表类测试共用的存储（只追加文件，互不影响断言）"""
+        return DataStorage(storage_dir=tmp_path_factory.mktemp("ds"))
+
+    @pytest.fixture(scope="module")
     def sample_results(self):
-        """创建示例采集结果"""
+        """创建示例采集结果（只读，整个模块共享）"""
         item1 = ContentItem(
             title="Test Video 1",
             url="https://example.com/1",
@@ -259,6 +329,34 @@ class TestDataStorage:
         assert data['total_items'] == 2
         assert len(data['results']) == 1
 
+        # 缩进格式与紧凑格式内容一致
+        pretty_path = storage.save_results(sample_results, filename="test_pretty.json", pretty=True)
+        pretty_data = json.loads(pretty_path.read_text(encoding='utf-8'))
+        assert pretty_data['results'] == data['results']
+        assert pretty_path.stat().st_size > filepath.stat().st_size
+
+    def test_save_results_is_atomic(self, temp_storage_dir, sample_results):
+        """测试写入失败时保留原文件且不留下临时文件"""
+        storage = DataStorage(storage_dir=temp_storage_dir)
+        filepath = storage.save_results(sample_results, filename="test_results.json")
+        original = filepath.read_bytes()
+
+        class BrokenResult:
+            success = True
+            items = []
+
+            def to_dict(self):
+                raise RuntimeError("写入中断")
+
+        with pytest.raises(RuntimeError):
+            storage.save_results(sample_results + [BrokenResult()], filename="test_results.json")
+
+        assert filepath.read_bytes() == original
+        assert [p.name for p in temp_storage_dir.iterdir()] == ["test_results.json"]
+
+        # 文件权限遵循进程的 umask
+        assert filepath.stat().st_mode & 0o777 == 0o666 & ~data_storage._UMASK
+
     def test_save_today_items_only(self, temp_storage_dir, sample_results):
         """测试只保存今天的内容"""
         storage = DataStorage(storage_dir=temp_storage_dir)
@@ -285,9 +383,87 @@ class TestDataStorage:
         assert loaded_data is not None
         assert loaded_data['total_authors'] == 1
 
-    def test_list_saved_files(self, temp_storage_dir, sample_results):
-        """测试列出保存的文件"""
+    def test_load_indexed_result(self, temp_storage_dir, sample_results):
+        """测试通过作者索引读取单个采集结果"""
         storage = DataStorage(storage_dir=temp_storage_dir)
+        storage.save_results(sample_results, filename="collection_test.json", build_index=True)
+
+        assert (temp_storage_dir / "collection_test.ndjson").exists()
+
+        index = storage.load_author_index()
+        assert "Author 1" in index
+
+        result = storage.load_indexed_result(index["Author 1"])
+        assert result['author_name'] == "Author 1"
+        assert len(result['items']) == 2
+
+        # 索引中记录了本次采集时间
+        assert index["Author 1"][3] == storage.load_results("collection_test.json")['collected_at']
+
+        # 同名文件重新保存且作者失败时，不保留指向已重写文件的旧条目
+        failed = CollectionResult(
+            author_name="Author 1",
+            author_url="https://example.com/author1",
+            category=CategoryType.VIDEO,
+            success=False,
+            error_message="error"
+        )
+        other = CollectionResult(
+            author_name="Author 2",
+            author_url="https://example.com/author2",
+            category=CategoryType.VIDEO,
+            success=True
+        )
+        storage.save_results([other, failed], filename="collection_test.json", build_index=True)
+        index = storage.load_author_index()
+        assert "Author 1" not in index
+        assert storage.load_indexed_result(index["Author 2"])['author_name'] == "Author 2"
+
+    def test_iter_results(self, temp_storage_dir, sample_results):
+        """测试逐条读取采集结果（NDJSON 与 JSON 两种格式）"""
+        storage = DataStorage(storage_dir=temp_storage_dir)
+        storage.save_results(sample_results, filename="with_index.json", build_index=True)
+        storage.save_results(sample_results, filename="without_index.json")
+
+        for filename in ("with_index.json", "without_index.json"):
+            results = list(storage.iter_results(filename))
+            assert len(results) == 1
+            assert results[0]['author_name'] == "Author 1"
+
+        # 不建索引重新保存同名文件时，旧的 NDJSON 和指向它的索引条目被移除
+        storage.save_results(sample_results * 2, filename="with_index.json")
+        assert not (temp_storage_dir / "with_index.ndjson").exists()
+        assert len(list(storage.iter_results("with_index.json"))) == 2
+        assert "Author 1" not in storage.load_author_index()
+
+    def test_load_results_streaming(self, temp_storage_dir, sample_results):
+        """测试流式读取采集结果（紧凑与缩进格式，小块读取跨越元素边界）"""
+        storage = DataStorage(storage_dir=temp_storage_dir)
+        results = sample_results * 3
+        storage.save_results(results, filename="compact.json")
+        storage.save_results(results, filename="pretty.json", pretty=True)
+
+        expected = storage.load_results("compact.json")['results']
+        for filename in ("compact.json", "pretty.json"):
+            assert list(storage.load_results_streaming(filename, chunk_size=7)) == expected
+            assert list(storage.load_results_streaming(filename)) == expected
+
+    def test_save_items_by_author(self, temp_storage_dir, sample_results):
+        """测试按作者分别保存内容"""
+        storage = DataStorage(storage_dir=temp_storage_dir)
+        saved_files = storage.save_items_by_author(sample_results)
+
+        assert list(saved_files) == ["Author 1"]
+
+        with open(saved_files["Author 1"], 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        assert data['author_name'] == "Author 1"
+        assert data['total_items'] == 2
+
+    def test_list_saved_files(self, shared_storage, sample_results):
+        """测试列出保存的文件"""
+        storage = shared_storage
 
         # 保存多个文件
         storage.save_results(sample_results, filename="file1.json")
@@ -296,9 +472,17 @@ class TestDataStorage:
         files = storage.list_saved_files()
         assert len(files) >= 2
 
-    def test_get_latest_file(self, temp_storage_dir, sample_results):
+        # 作者索引和缓存文件不算作保存的采集结果
+        storage.save_results(sample_results, filename="file3.json", build_index=True)
+        (storage.storage_dir / ".feed_url_cache.json").write_text("{}", encoding='utf-8')
+        names = [f.name for f in storage.list_saved_files()]
+        assert storage.AUTHOR_INDEX_FILENAME not in names
+        assert ".feed_url_cache.json" not in names
+        assert storage.get_latest_file().name == "file3.json"
+
+    def test_get_latest_file(self, shared_storage, sample_results):
         """测试获取最新文件"""
-        storage = DataStorage(storage_dir=temp_storage_dir)
+        storage = shared_storage
 
         storage.save_results(sample_results, filename="old.json")
         import time
@@ -309,6 +493,10 @@ class TestDataStorage:
         assert latest is not None
         assert latest.name == "new.json"
 
+        # 按模式筛选
+        assert storage.get_latest_file(pattern="old*.json").name == "old.json"
+        assert storage.get_latest_file(pattern="missing_*.json") is None
+
     def test_create_summary_report(self, sample_results):
         """测试创建摘要报告"""
         storage = DataStorage()
@@ -318,6 +506,22 @@ class TestDataStorage:
         assert report['summary']['total_authors'] == 1
         assert report['summary']['total_items'] == 2
         assert report['summary']['today_items'] == 1
+        assert report['by_category']['Video'] == {'authors': 1, 'items': 2, 'today_items': 1}
+
+
+class TestCollectorManager:
+    """测试采集管理器"""
+
+    def test_max_workers_limited_by_pool_size(self, tmp_path):
+        """测试并发数不超过共享连接池大小"""
+        config_manager = ConfigManager(config_path=tmp_path / "config.json")
+
+        assert CollectorManager(config_manager).max_workers == CollectorManager.MAX_WORKERS
+        assert CollectorManager(config_manager, max_workers=4).max_workers == 4
+        assert CollectorManager(config_manager, max_workers=100).max_workers == BaseCollector.POOL_SIZE
+
+        with pytest.raises(ValueError):
+            CollectorManager(config_manager, max_workers=0)
 
 
 class TestYouTubeCollector:
@@ -335,22 +539,286 @@ class TestYouTubeCollector:
         assert collector is not None
         assert collector.author.name == "Test Channel"
 
-    def test_extract_video_id(self):
-        """测试提取视频ID"""
+    def test_create_collector_with_session(self):
+        """测试通过 create_collector 注入 HTTP 会话"""
+        session = FakeSession([])
+        author = Author(
+            name="Test",
+            url="https://www.youtube.com/channel/UC1234567890",
+            category=CategoryType.VIDEO
+        )
+
+        collector = create_collector(author, session=session)
+        assert isinstance(collector, YouTubeCollector)
+        assert collector.session is session
+
+    def test_channel_id_from_handle_page(self):
+        """测试从 @handle 频道页面解析频道ID"""
+        pages = [
+            b"""<html><head><link rel="alternate" type="application/rss+xml"
+                href="https://www.youtube.com/feeds/videos.xml?channel_id=UCfromLink"></head></html>""",
+            b"""<html><head><meta property="og:url" content="https://www.youtube.com/channel/UCfromMeta"></head></html>""",
+            b"""<html><body><script>var data = {"channelId":"UCfromScript"};</script></body></html>""",
+        ]
+        session = FakeSession([FakeResponse(200, page) for page in pages])
+
         author = Author(
             name="Test",
             url="https://www.youtube.com/@test",
             category=CategoryType.VIDEO
         )
 
+        assert [YouTubeCollector(author, session=session).channel_id for _ in pages] == [
+            "UCfromLink", "UCfromMeta", "UCfromScript"
+        ]
+
+    def test_collect_uses_conditional_get(self):
+        """测试频道 Feed 未变化（304）时复用缓存的内容"""
+        feed = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns:media="http://search.yahoo.com/mrss/">
+<title>Test Channel</title>
+<entry>
+  <yt:videoId>dQw4w9WgXcQ</yt:videoId>
+  <title>Video 1</title>
+  <link rel="alternate" href="https://www.youtube.com/watch?v=dQw4w9WgXcQ"/>
+  <published>2024-01-01T00:00:00+00:00</published>
+</entry>
+</feed>"""
+        author = Author(
+            name="Test Channel",
+            url="https://www.youtube.com/channel/UC1234567890",
+            category=CategoryType.VIDEO
+        )
+        collector = YouTubeCollector(author, session=FakeSession([
+            FakeResponse(200, feed, {'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+            FakeResponse(304),
+        ]))
+
+        first = collector.collect()
+        assert first.success
+        assert first.items[0].content_id == "dQw4w9WgXcQ"
+
+        second = collector.collect()
+        assert collector.session.sent_headers[1] == {'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+        assert [item.content_id for item in second.items] == ["dQw4w9WgXcQ"]
+
+    def test_conditional_get_respects_max_items(self):
+        """测试频道 Feed 缓存条目不足本次上限时重新下载，304 时按本次上限截取"""
+        entries = b"".join(
+            b"<entry><yt:videoId>video%05d_x</yt:videoId><title>Video %d</title>"
+            b"<link rel=\"alternate\" href=\"https://www.youtube.com/watch?v=video%05d_x\"/></entry>" % (i, i, i)
+            for i in range(10)
+        )
+        feed = (b'<feed xmlns="http://www.w3.org/2005/Atom" '
+                b'xmlns:yt="http://www.youtube.com/xml/schemas/2015">' + entries + b'</feed>')
+        author = Author(
+            name="Test Channel",
+            url="https://www.youtube.com/channel/UC1234567890",
+            category=CategoryType.VIDEO
+        )
+        collector = YouTubeCollector(author, session=FakeSession([
+            FakeResponse(200, feed, {'ETag': '"v1"'}),
+            FakeResponse(200, feed, {'ETag': '"v1"'}),
+            FakeResponse(304),
+        ]))
+
+        assert len(collector.collect(max_items=2).items) == 2
+
+        assert len(collector.collect(max_items=10).items) == 10
+        assert collector.session.sent_headers[1] == {}
+
+        cached = collector.collect(max_items=5)
+        assert collector.session.sent_headers[2] == {'If-None-Match': '"v1"'}
+        assert [item.title for item in cached.items] == [f"Video {i}" for i in range(5)]
+
+    def test_parse_feed_fast_matches_feedparser(self):
+        """测试 lxml 解析 Atom 与 feedparser 结果一致，非 Atom 内容退回 feedparser"""
+        feed = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns:media="http://search.yahoo.com/mrss/">
+<title>Test Channel</title>
+<entry>
+  <yt:videoId>dQw4w9WgXcQ</yt:videoId>
+  <title>Video &amp; 1</title>
+  <link rel="alternate" href="https://www.youtube.com/watch?v=dQw4w9WgXcQ"/>
+  <published>2024-01-01T00:00:00+00:00</published>
+  <media:group>
+    <media:thumbnail url="https://i1.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg" width="480" height="360"/>
+    <media:description>Description</media:description>
+  </media:group>
+</entry>
+</feed>"""
+        author = Author(
+            name="Test Channel",
+            url="https://www.youtube.com/channel/UC1234567890",
+            category=CategoryType.VIDEO
+        )
         collector = YouTubeCollector(author)
 
-        # 测试不同格式的URL
-        video_id1 = collector._extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
-        assert video_id1 == "dQw4w9WgXcQ"
+        fast = [collector._parse_atom_entry(e) for e in collector._parse_feed_fast(feed)]
+        slow = [collector._parse_entry(e) for e in collector._parse_feed(FakeResponse(200, feed)).entries]
+        for fast_item, slow_item in zip(fast, slow, strict=True):
+            fast_item.collected_at = slow_item.collected_at
+            assert fast_item.to_dict() == slow_item.to_dict()
+        assert fast[0].title == "Video & 1"
+        assert fast[0].thumbnail_url == "https://i1.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg"
+
+        assert collector._parse_feed_fast(b"<rss><channel></channel></rss>") is None
+        assert collector._parse_feed_fast(b"not xml") is None
+
+    def test_parse_published(self):
+        """测试解析发布时间字符串（统一为本地时间）"""
+        expected = datetime(2024, 1, 15, 12, 34, 56, tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+
+        assert YouTubeCollector._parse_published("2024-01-15T12:34:56+00:00") == expected
+        assert YouTubeCollector._parse_published("2024-01-15T12:34:56Z") == expected
+        assert YouTubeCollector._parse_published("Mon, 15 Jan 2024 12:34:56 GMT") == expected
+        assert YouTubeCollector._parse_published("not a date") is None
+
+    @pytest.fixture(scope="module")
+    def yt_collector(self):
+        """提取视频ID用的采集器（频道URL无需联网，整个模块共享）"""
+        author = Author(
+            name="Test",
+            url="https://www.youtube.com/channel/UC1234567890",
+            category=CategoryType.VIDEO
+        )
+        return YouTubeCollector(author)
+
+    @pytest.mark.parametrize("url", [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+    ])
+    def test_extract_video_id(self, yt_collector, url):
+        """测试从不同格式的URL提取视频ID"""
+        assert yt_collector._extract_video_id(url) == "dQw4w9WgXcQ"
+
+
+class TestPodcastCollector:
+    """测试 Podcast 采集器"""
+
+    RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Episode 1</title><link>https://example.com/ep1</link>
+<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+    def test_clean_description(self):
+        """测试清理简介中的 HTML 标签"""
+        cleaned = PodcastCollector._clean_description("<p>Tom &amp; Jerry<br/> <b>show</b></p>")
+        assert cleaned == "Tom & Jerry show"
+
+        long_text = PodcastCollector._clean_description("<p>" + "a" * 600 + "</p>")
+        assert long_text == "a" * 500 + "..."
 
-        video_id2 = collector._extract_video_id("https://youtu.be/dQw4w9WgXcQ")
-        assert video_id2 == "dQw4w9WgXcQ"
+    def test_collect_uses_conditional_get(self):
+        """测试 Feed 未变化（304）时复用缓存的内容"""
+        author = Author(
+            name="Test Podcast",
+            url="https://example.com/feed/",
+            category=CategoryType.PODCAST
+        )
+        collector = PodcastCollector(author, session=FakeSession([
+            FakeResponse(200, self.RSS, {'ETag': '"v1"', 'Content-Type': 'application/rss+xml'}),
+            FakeResponse(304),
+        ]))
+
+        first = collector.collect()
+        assert first.success
+        assert first.items[0].title == "Episode 1"
+        assert collector.session.sent_headers[0] == {}
+
+        second = collector.collect()
+        assert second.success
+        assert collector.session.sent_headers[1] == {'If-None-Match': '"v1"'}
+        assert [item.url for item in second.items] == [item.url for item in first.items]
+        # 缓存的内容列表不应被调用方修改影响
+        assert second.items is not first.items
+
+    def test_conditional_get_respects_max_items(self):
+        """测试缓存条目不足本次上限时重新下载，304 时按本次上限截取"""
+        rss = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Episode 1</title><link>https://example.com/ep1</link></item>
+<item><title>Episode 2</title><link>https://example.com/ep2</link></item>
+<item><title>Episode 3</title><link>https://example.com/ep3</link></item>
+</channel></rss>"""
+        author = Author(
+            name="Test Podcast",
+            url="https://example.com/feed/",
+            category=CategoryType.PODCAST
+        )
+        collector = PodcastCollector(author, session=FakeSession([
+            FakeResponse(200, rss, {'ETag': '"v1"'}),
+            FakeResponse(200, rss, {'ETag': '"v1"'}),
+            FakeResponse(304),
+        ]))
+
+        assert len(collector.collect(max_items=1).items) == 1
+
+        # 上次只解析了 1 条，不能用 304 复用
+        assert len(collector.collect(max_items=3).items) == 3
+        assert collector.session.sent_headers[1] == {}
+
+        smaller = collector.collect(max_items=2)
+        assert collector.session.sent_headers[2] == {'If-None-Match': '"v1"'}
+        assert [item.title for item in smaller.items] == ["Episode 1", "Episode 2"]
+
+
+class TestNewsCollector:
+    """测试新闻/博客采集器"""
+
+    def test_discover_feed_url(self, tmp_path):
+        """测试从页面的 link 标签发现 Feed 地址，并缓存发现结果"""
+        page = b"""<html><head>
+<link rel="alternate" type="application/atom+xml" href="/atom.xml">
+<link rel="alternate" type="application/rss+xml" href="/rss.xml">
+</head><body></body></html>"""
+        session = FakeSession([FakeResponse(200, page)])
+        cache = FeedUrlCache(tmp_path / FeedUrlCache.FILENAME)
+
+        author = Author(
+            name="Test Blog",
+            url="https://blog.example.com/",
+            category=CategoryType.NEWS
+        )
+        collector = create_collector(author, session=session, feed_url_cache=cache)
+
+        assert collector.feed_url == "https://blog.example.com/rss.xml"
+        assert news_collector.get_default_feed_url_cache() is not cache
+
+        # 有修改的缓存登记到退出时保存的列表，保存后移除
+        assert cache in news_collector._pending_caches
+        cache.save()
+        assert cache not in news_collector._pending_caches
+        cache.set("https://other.example.com", "https://other.example.com/feed/")
+        news_collector._save_pending_caches()
+        assert cache not in news_collector._pending_caches
+
+        # 缓存命中时不再请求站点页面
+        reloaded = FeedUrlCache(cache.cache_path)
+        assert NewsCollector(author, session=session, feed_url_cache=reloaded).feed_url == "https://blog.example.com/rss.xml"
+        assert len(session.sent_headers) == 1
+
+    @pytest.mark.parametrize("content", [
+        '["https://blog.example.com"]',
+        '"cache"',
+        '{"https://blog.example.com": "https://blog.example.com/feed/"}',
+        '{"https://blog.example.com": ["https://blog.example.com/feed/"]}',
+        '{"https://blog.example.com": [null, "ts"]}',
+    ])
+    def test_feed_url_cache_ignores_malformed_file(self, tmp_path, content):
+        """测试缓存文件内容格式错误时按未命中处理"""
+        cache_path = tmp_path / FeedUrlCache.FILENAME
+        cache_path.write_text(content, encoding='utf-8')
+        cache = FeedUrlCache(cache_path)
+
+        assert cache.get("https://blog.example.com") is None
+
+        cache.set("https://blog.example.com", "https://blog.example.com/rss.xml")
+        assert cache.get("https://blog.example.com") == "https://blog.example.com/rss.xml"
 
 
 if __name__ == "__main__":
@@ -96,9 +96,9 @@ class TestSettings:
 class TestConfigManager:
     """测试 ConfigManager 配置管理器"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_config(self):
-        """创建示例配置数据"""
+        """创建示例配置数据（只读，整个模块共享）"""
         return {
             "authors": [
                 {
@@ -127,17 +127,11 @@ class TestConfigManager:
         }
 
     @pytest.fixture
-    def temp_config_file(self, sample_config):
-        """创建临时配置文件"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as f:
-            json.dump(sample_config, f)
-            temp_path = Path(f.name)
-
-        yield temp_path
-
-        # 清理临时文件
-        if temp_path.exists():
-            temp_path.unlink()
+    def temp_config_file(self, tmp_path, sample_config):
+        """创建临时配置文件（由 pytest 统一清理）"""
+        temp_path = tmp_path / "config.json"
+        temp_path.write_text(json.dumps(sample_config), encoding='utf-8')
+        return temp_path
 
     def test_load_config(self, temp_config_file):
         """测试加载配置文件"""
@@ -178,6 +172,22 @@ class TestConfigManager:
         news_authors = manager.get_authors_by_category(CategoryType.NEWS)
         assert len(news_authors) == 0
 
+        # 启用状态变化和新增作者后结果同步更新
+        manager.authors[2].enabled = True
+        assert [a.name for a in manager.get_authors_by_category(CategoryType.NEWS)] == ["Author 3"]
+
+        manager.add_author("Author 4", "https://example.com/author4", CategoryType.VIDEO)
+        assert len(manager.get_authors_by_category(CategoryType.VIDEO)) == 2
+
+        # 作者数量不变的增删和分类修改同样能反映出来
+        manager.authors.pop(2)
+        manager.add_author("Author 5", "https://example.com/author5", CategoryType.VIDEO)
+        assert manager.get_authors_by_category(CategoryType.NEWS) == []
+        assert [a.name for a in manager.get_authors_by_category(CategoryType.VIDEO)] == ["Author 1", "Author 4", "Author 5"]
+
+        manager.authors[0].category = CategoryType.NEWS
+        assert [a.name for a in manager.get_authors_by_category(CategoryType.NEWS)] == ["Author 1"]
+
     def test_add_author(self, temp_config_file):
         """测试添加新作者"""
         manager = ConfigManager(config_path=temp_config_file)
@@ -1,47 +1,76 @@
 """
 快速测试新采集器
 """
-from config_manager import ConfigManager, Author, CategoryType
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from config_manager import Author, CategoryType
 from podcast_collector import PodcastCollector
 from news_collector import NewsCollector
 
-# 测试 Podcast 采集器
-print("=" * 60)
-print("测试 Podcast 采集器")
-print("=" * 60)
-podcast_author = Author(
-    name="Lex Fridman Podcast",
-    url="https://lexfridman.com/podcast/",
-    category=CategoryType.PODCAST,
-    enabled=True
-)
-podcast_collector = PodcastCollector(podcast_author)
-print(f"RSS URL: {podcast_collector.rss_url}")
-result = podcast_collector.collect(max_items=5)
-print(f"Success: {result.success}")
-if result.success:
-    print(f"Items collected: {len(result.items)}")
-    for item in result.items[:2]:
-        print(f"  - {item.title}")
-else:
-    print(f"Error: {result.error_message}")
-
-print("\n" + "=" * 60)
-print("测试 News 采集器")
-print("=" * 60)
-news_author = Author(
-    name="Simon Willison's Blog",
-    url="https://simonwillison.net/",
-    category=CategoryType.NEWS,
-    enabled=True
-)
-news_collector = NewsCollector(news_author)
-print(f"Feed URL: {news_collector.feed_url}")
-result = news_collector.collect(max_items=5)
-print(f"Success: {result.success}")
-if result.success:
-    print(f"Items collected: {len(result.items)}")
-    for item in result.items[:2]:
-        print(f"  - {item.title}")
-else:
-    print(f"Error: {result.error_message}")
+
+def _collect_report(title: str, collector, feed_line: str) -> List[str]:
+    """
+    采集并生成单个采集器的测试报告
+
+    Args:
+        title: 报告标题
+        collector: 采集器实例
+        feed_line: 显示 Feed 地址的一行
+
+    Returns:
+        List[str]: 报告的各行内容
+    """
+    lines = ["=" * 60, title, "=" * 60, feed_line]
+
+    result = collector.collect(max_items=5)
+    lines.append(f"Success: {result.success}")
+    if result.success:
+        lines.append(f"Items collected: {len(result.items)}")
+        for item in result.items[:2]:
+            lines.append(f"  - {item.title}")
+    else:
+        lines.append(f"Error: {result.error_message}")
+
+    return lines
+
+
+def _test_podcast(author: Author) -> List[str]:
+    """测试 Podcast 采集器"""
+    collector = PodcastCollector(author)
+    return _collect_report("测试 Podcast 采集器", collector, f"RSS URL: {collector.rss_url}")
+
+
+def _test_news(author: Author) -> List[str]:
+    """测试 News 采集器"""
+    collector = NewsCollector(author)
+    return _collect_report("测试 News 采集器", collector, f"Feed URL: {collector.feed_url}")
+
+
+def main():
+    """并发运行两个采集器，最后统一输出结果"""
+    podcast_author = Author(
+        name="Lex Fridman Podcast",
+        url="https://lexfridman.com/podcast/",
+        category=CategoryType.PODCAST,
+        enabled=True
+    )
+    news_author = Author(
+        name="Simon Willison's Blog",
+        url="https://simonwillison.net/",
+        category=CategoryType.NEWS,
+        enabled=True
+    )
+
+    # 两个采集都以网络 I/O 为主，并发执行
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        podcast_future = executor.submit(_test_podcast, podcast_author)
+        news_future = executor.submit(_test_news, news_author)
+        reports = [podcast_future.result(), news_future.result()]
+
+    sys.stdout.write("\n\n".join("\n".join(lines) for lines in reports) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,29 +3,57 @@ YouTube 内容采集器
 通过 RSS Feed 采集 YouTube 频道内容
 """
 import re
-import feedparser
-from datetime import datetime
+from itertools import islice
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import List, Optional
-from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
+import requests
+from lxml import etree, html as lxml_html
 
 from base_collector import BaseCollector
 from content_model import ContentItem, CollectionResult
 from config_manager import Author, CategoryType
 
+# 视频ID（watch?v=、youtu.be/、embed/ 等格式都以 "v=" 或 "/" 开头）
+_VIDEO_ID_RE = re.compile(r'(?:v=|/)([0-9A-Za-z_-]{11})')
+
+# 频道ID：频道URL、RSS 地址参数
+_CHANNEL_ID_RE = re.compile(r'/channel/([a-zA-Z0-9_-]+)')
+_CHANNEL_ID_HREF_RE = re.compile(r'channel_id=([a-zA-Z0-9_-]+)')
+
+# 直接在原始页面字节上查找频道ID，命中时无需解析 DOM
+_FEED_CHANNEL_ID_BYTES_RE = re.compile(rb'feeds/videos\.xml\?channel_id=([a-zA-Z0-9_-]+)')
+_CHANNEL_ID_JS_BYTES_RE = re.compile(rb'"channelId":"([a-zA-Z0-9_-]+)"')
+
+# 频道页面中的 RSS link 和 og:url meta
+_RSS_LINK_HREF_XPATH = etree.XPath(
+    "//link[contains(concat(' ', normalize-space(@rel), ' '), ' alternate ')]"
+    "[@type='application/rss+xml']/@href"
+)
+_OG_URL_XPATH = etree.XPath("//meta[@property='og:url']/@content")
+
+# 频道 Feed（Atom）的命名空间和条目
+_ATOM_NS = {
+    'a': 'http://www.w3.org/2005/Atom',
+    'yt': 'http://www.youtube.com/xml/schemas/2015',
+    'media': 'http://search.yahoo.com/mrss/',
+}
+_ATOM_ENTRY_XPATH = etree.XPath('/a:feed/a:entry', namespaces=_ATOM_NS)
+
 
 class YouTubeCollector(BaseCollector):
     """YouTube 采集器"""
 
-    def __init__(self, author: Author, timeout: int = 30):
+    def __init__(self, author: Author, timeout: int = 30, session: Optional[requests.Session] = None):
         """
         初始化 YouTube 采集器
 
         Args:
             author: 作者配置对象
             timeout: 请求超时时间
+            session: HTTP 会话，None则使用共享会话
         """
-        super().__init__(author, timeout)
+        super().__init__(author, timeout, session)
         self.channel_id = self._extract_channel_id()
         self.rss_url = None
 
@@ -46,7 +74,7 @@ class YouTubeCollector(BaseCollector):
             return self._get_channel_id_from_handle(url)
 
         # 如果是 /channel/ID 格式
-        channel_match = re.search(r'/channel/([a-zA-Z0-9_-]+)', url)
+        channel_match = _CHANNEL_ID_RE.search(url)
         if channel_match:
             return channel_match.group(1)
 
@@ -71,30 +99,31 @@ class YouTubeCollector(BaseCollector):
             if not response:
                 return None
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            content = response.content
+
+            # 先在原始字节中查找 RSS 地址中的频道ID（位于页面头部，通常可直接命中）
+            match = _FEED_CHANNEL_ID_BYTES_RE.search(content)
+            if match:
+                return match.group(1).decode('ascii')
+
+            tree = lxml_html.fromstring(content)
 
             # 尝试从页面中提取频道ID
             # 方法1: 从 link 标签中提取
-            rss_link = soup.find('link', {'rel': 'alternate', 'type': 'application/rss+xml'})
-            if rss_link and rss_link.get('href'):
-                match = re.search(r'channel_id=([a-zA-Z0-9_-]+)', rss_link['href'])
-                if match:
-                    return match.group(1)
+            channel_id = self._channel_id_from_rss_link(tree)
+            if channel_id:
+                return channel_id
 
             # 方法2: 从 meta 标签中提取
-            channel_id_meta = soup.find('meta', {'property': 'og:url'})
-            if channel_id_meta and channel_id_meta.get('content'):
-                match = re.search(r'/channel/([a-zA-Z0-9_-]+)', channel_id_meta['content'])
+            for og_url in _OG_URL_XPATH(tree):
+                match = _CHANNEL_ID_RE.search(og_url)
                 if match:
                     return match.group(1)
 
-            # 方法3: 从 script 中提取
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if script.string and 'channelId' in script.string:
-                    match = re.search(r'"channelId":"([a-zA-Z0-9_-]+)"', script.string)
-                    if match:
-                        return match.group(1)
+            # 方法3: 从 script 中提取（直接扫描原始字节，不逐个遍历 script 标签）
+            match = _CHANNEL_ID_JS_BYTES_RE.search(content)
+            if match:
+                return match.group(1).decode('ascii')
 
         except Exception as e:
             print(f"从handle获取频道ID失败: {e}")
@@ -116,20 +145,32 @@ class YouTubeCollector(BaseCollector):
             if not response:
                 return None
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-
             # 从 link 标签中提取
-            rss_link = soup.find('link', {'rel': 'alternate', 'type': 'application/rss+xml'})
-            if rss_link and rss_link.get('href'):
-                match = re.search(r'channel_id=([a-zA-Z0-9_-]+)', rss_link['href'])
-                if match:
-                    return match.group(1)
+            return self._channel_id_from_rss_link(lxml_html.fromstring(response.content))
 
         except Exception as e:
             print(f"从页面获取频道ID失败: {e}")
 
         return None
 
+    @staticmethod
+    def _channel_id_from_rss_link(tree) -> Optional[str]:
+        """
+        从页面的 RSS link 标签中提取频道ID
+
+        Args:
+            tree: lxml 解析的页面
+
+        Returns:
+            str: 频道ID，失败返回None
+        """
+        for href in _RSS_LINK_HREF_XPATH(tree):
+            match = _CHANNEL_ID_HREF_RE.search(href)
+            if match:
+                return match.group(1)
+
+        return None
+
     def collect(self, max_items: int = 10) -> CollectionResult:
         """
         采集 YouTube 频道内容
@@ -145,22 +186,30 @@ class YouTubeCollector(BaseCollector):
             return self._create_error_result("无法获取频道ID，请检查URL格式")
 
         try:
-            # 解析 RSS Feed
-            feed = feedparser.parse(self.rss_url)
-
-            if not feed.entries:
+            # 使用条件请求获取 RSS Feed，未变化时直接返回缓存的内容
+            response = self._fetch_feed(self.rss_url, max_items)
+            if response is None:
+                return self._create_error_result("获取 Feed 失败")
+
+            if response.status_code == 304:
+                return self._create_cached_feed_result(max_items)
+
+            # 优先用 lxml 直接解析 Atom，无法解析时退回 feedparser
+            entries = self._parse_feed_fast(response.content)
+            if entries is not None:
+                parse_entry = self._parse_atom_entry
+            else:
+                entries = self._parse_feed(response).entries
+                parse_entry = self._parse_entry
+
+            if not entries:
                 return self._create_error_result("未找到任何视频内容")
 
-            items = []
-            for entry in feed.entries[:max_items]:
-                try:
-                    item = self._parse_entry(entry)
-                    if item:
-                        items.append(item)
-                except Exception as e:
-                    print(f"解析条目失败: {e}")
-                    continue
+            # 条目解析方法内部已处理异常，解析失败时返回 None
+            parsed = map(parse_entry, islice(entries, max_items))
+            items = [item for item in parsed if item is not None]
 
+            self._cache_feed(response, items, max_items)
             return self._create_success_result(items)
 
         except Exception as e:
@@ -184,51 +233,148 @@ class YouTubeCollector(BaseCollector):
 
             # 提取发布时间
             publish_date = None
-            if 'published_parsed' in entry and entry.published_parsed:
-                from time import struct_time
-                import calendar
-                publish_date = datetime.fromtimestamp(
-                    calendar.timegm(entry.published_parsed)
-                )
+            published_parsed = entry.get('published_parsed')
+            if published_parsed:
+                # feedparser 给出的是 UTC 时间，转换为本地时间（不带时区）
+                publish_date = datetime(
+                    *published_parsed[:6], tzinfo=timezone.utc
+                ).astimezone().replace(tzinfo=None)
             elif 'published' in entry:
-                try:
-                    publish_date = date_parser.parse(entry.published)
-                except:
-                    pass
+                publish_date = self._parse_published(entry.published)
 
             # 提取缩略图
             thumbnail_url = None
-            if 'media_thumbnail' in entry and entry.media_thumbnail:
-                thumbnail_url = entry.media_thumbnail[0].get('url')
-
-            # 如果没有缩略图，尝试从视频ID提取
-            if not thumbnail_url:
-                video_id = self._extract_video_id(url)
-                if video_id:
-                    thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg"
-
-            # 提取视频ID作为唯一标识
-            content_id = self._extract_video_id(url)
-
-            # 创建内容项
-            item = ContentItem(
-                title=title,
-                url=url,
-                author_name=self.author.name,
-                author_url=self.author.url,
-                category=CategoryType.VIDEO,
-                description=description,
-                publish_date=publish_date,
-                thumbnail_url=thumbnail_url,
-                content_id=content_id
-            )
+            media_thumbnail = entry.get('media_thumbnail')
+            if media_thumbnail:
+                thumbnail_url = media_thumbnail[0].get('url')
 
-            return item
+            return self._create_item(title, url, description, publish_date, thumbnail_url)
 
         except Exception as e:
             print(f"解析条目失败: {e}")
             return None
 
+    @staticmethod
+    def _parse_feed_fast(xml_bytes: bytes) -> Optional[list]:
+        """
+        用 lxml 解析频道 Atom Feed
+
+        YouTube 频道 Feed 结构固定，直接在 C 层解析 XML 并按命名空间取字段，
+        比 feedparser 的通用解析快得多
+
+        Args:
+            xml_bytes: Feed 原始内容
+
+        Returns:
+            list: Atom 条目元素列表，不是可解析的 Atom Feed 时返回None
+        """
+        try:
+            parser = etree.XMLParser(resolve_entities=False, no_network=True)
+            root = etree.fromstring(xml_bytes, parser)
+        except (etree.XMLSyntaxError, ValueError):
+            return None
+
+        if root is None or root.tag != '{http://www.w3.org/2005/Atom}feed':
+            return None
+        return _ATOM_ENTRY_XPATH(root)
+
+    def _parse_atom_entry(self, entry) -> Optional[ContentItem]:
+        """
+        解析单个 Atom 条目元素
+
+        Args:
+            entry: lxml 条目元素
+
+        Returns:
+            ContentItem: 内容项，失败返回None
+        """
+        try:
+            title = entry.findtext('a:title', '', _ATOM_NS).strip()
+            url = ''
+            for link in entry.iterfind('a:link', _ATOM_NS):
+                if link.get('rel', 'alternate') == 'alternate':
+                    url = link.get('href', '')
+                    break
+            description = entry.findtext('media:group/media:description', '', _ATOM_NS).strip()
+
+            published = entry.findtext('a:published', None, _ATOM_NS)
+            publish_date = self._parse_published(published.strip()) if published else None
+
+            thumbnail = entry.find('media:group/media:thumbnail', _ATOM_NS)
+            thumbnail_url = thumbnail.get('url') if thumbnail is not None else None
+
+            return self._create_item(
+                title, url, description, publish_date, thumbnail_url,
+                entry.findtext('yt:videoId', None, _ATOM_NS)
+            )
+
+        except Exception as e:
+            print(f"解析条目失败: {e}")
+            return None
+
+    def _create_item(self, title: str, url: str, description: str,
+                     publish_date: Optional[datetime], thumbnail_url: Optional[str],
+                     video_id: Optional[str] = None) -> ContentItem:
+        """
+        由条目字段创建内容项
+
+        Args:
+            title: 标题
+            url: 视频URL
+            description: 描述
+            publish_date: 发布时间
+            thumbnail_url: 缩略图URL
+            video_id: 视频ID，None则从URL提取
+
+        Returns:
+            ContentItem: 内容项
+        """
+        # 视频ID作为唯一标识（同时用于生成缩略图）
+        if not video_id:
+            video_id = self._extract_video_id(url)
+
+        # 如果没有缩略图，尝试从视频ID生成
+        if not thumbnail_url and video_id:
+            thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg"
+
+        return ContentItem(
+            title=title,
+            url=url,
+            author_name=self.author.name,
+            author_url=self.author.url,
+            category=CategoryType.VIDEO,
+            description=description,
+            publish_date=publish_date,
+            thumbnail_url=thumbnail_url,
+            content_id=video_id
+        )
+
+    @staticmethod
+    def _parse_published(value: str) -> Optional[datetime]:
+        """
+        解析发布时间字符串
+
+        YouTube Feed 使用 RFC 3339 格式，优先用 fromisoformat 解析，
+        其他格式再尝试 RFC 2822；带时区的时间转换为本地时间
+
+        Args:
+            value: 发布时间字符串
+
+        Returns:
+            datetime: 本地时间（不带时区），无法解析返回None
+        """
+        try:
+            publish_date = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except (ValueError, AttributeError):
+            try:
+                publish_date = parsedate_to_datetime(value)
+            except (TypeError, ValueError, IndexError):
+                return None
+
+        if publish_date.tzinfo is not None:
+            publish_date = publish_date.astimezone().replace(tzinfo=None)
+        return publish_date
+
     def _extract_video_id(self, url: str) -> Optional[str]:
         """
         从YouTube URL中提取视频ID
@@ -239,41 +385,34 @@ class YouTubeCollector(BaseCollector):
         Returns:
             str: 视频ID，失败返回None
         """
-        patterns = [
-            r'(?:v=|/)([0-9A-Za-z_-]{11}).*',
-            r'(?:embed/)([0-9A-Za-z_-]{11})',
-            r'(?:watch\?v=)([0-9A-Za-z_-]{11})'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-
-        return None
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
 
 
-def create_collector(author: Author) -> Optional[BaseCollector]:
+def create_collector(author: Author, session: Optional[requests.Session] = None,
+                     feed_url_cache=None) -> Optional[BaseCollector]:
     """
     创建合适的采集器
 
     Args:
         author: 作者配置对象
+        session: HTTP 会话，None则使用所有采集器共享的会话
+        feed_url_cache: News 采集器使用的 Feed 地址缓存，None则使用默认缓存
 
     Returns:
         BaseCollector: 采集器实例，失败返回None
     """
     # 根据分类创建采集器
     if author.category == CategoryType.VIDEO:
-        return YouTubeCollector(author)
+        return YouTubeCollector(author, session=session)
     elif author.category == CategoryType.PODCAST:
         # 导入 Podcast 采集器
         from podcast_collector import PodcastCollector
-        return PodcastCollector(author)
+        return PodcastCollector(author, session=session)
     elif author.category == CategoryType.NEWS:
         # 导入 News 采集器
         from news_collector import NewsCollector
-        return NewsCollector(author)
+        return NewsCollector(author, session=session, feed_url_cache=feed_url_cache)
 
     # 可以在这里添加其他平台的采集器
     # elif 'podcast' in url: